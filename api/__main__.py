@@ -1,24 +1,113 @@
 """Allow running: python -m api"""
 import os
-import uvicorn
+import socket
+import sys
+import threading
 
 
-def _resolve_port() -> int:
-    """Resolve the correct port, handling Railway's Postgres PORT override."""
-    # RAILWAY_PORT is the internal web port (preferred).
-    # PORT might be overridden by Postgres addon to 5432.
-    for var in ("RAILWAY_PORT", "PORT"):
-        val = os.getenv(var)
-        if val:
+_env = os.environ
+_railway_port, _env_port = _env.get("RAILWAY_PORT"), _env.get("PORT")
+
+
+def _bind_socket(port: int) -> socket.socket:
+    """Create the listening socket up front, independent of uvicorn startup.
+
+    SO_REUSEPORT lets a replacement process bind the same port while the old
+    one drains (and lets the kernel balance across processes that share it).
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if hasattr(socket, "SO_REUSEPORT"):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind(("0.0.0.0", port))
+    sock.listen(2048)
+    return sock
+
+
+def _prewarm_imports() -> None:
+    """Warm modules that api.server imports lazily (scipy.optimize for the
+    calibrator) in a daemon thread, so they load while uvicorn is already
+    serving rather than ahead of the bind or on the first calibration run.
+    """
+    def _run():
+        for name in ("scipy.optimize",):
             try:
-                p = int(val)
-                if p != 5432:  # Never bind to Postgres
-                    return p
-            except ValueError:
+                __import__(name)
+            except ImportError:
                 pass
-    return 8000
 
+    threading.Thread(target=_run, name="prewarm-imports", daemon=True).start()
+
+
+def _loop_and_http() -> tuple:
+    """Pick the C event loop + HTTP parser (uvloop/httptools) when available.
+
+    Both ship with uvicorn[standard]; platforms without them (Windows for
+    uvloop) fall back to uvicorn's pure-Python asyncio loop and h11 parser.
+    """
+    try:
+        import uvloop  # noqa: F401
+        import httptools  # noqa: F401
+    except ImportError:
+        return "auto", "auto"
+    return "uvloop", "httptools"
+
+
+# RAILWAY_PORT is the internal web port (preferred); PORT might be overridden
+# by the Postgres addon to 5432, which we never bind to.
+port = next((int(v) for v in (_railway_port, _env_port)
+             if v and v.isascii() and v.isdecimal() and int(v) != 5432), 8000)
+loop, http = _loop_and_http()
+_web_concurrency = _env.get("WEB_CONCURRENCY", "")
+workers = int(_web_concurrency) if _web_concurrency.isascii() and _web_concurrency.isdecimal() else 1
+reload = bool(_env.get("UVICORN_RELOAD"))
+# Per-request access lines are opt-in; when serving in-process, uvicorn's own
+# startup/error logs flow through the root handler that api.server configures
+# (log_config=None skips uvicorn's dictConfig pass).
+access_log = _env.get("UVICORN_ACCESS_LOG", "0") == "1"
+# Long-lived responses (the dashboard's SSE stream) never finish on their own;
+# cap graceful shutdown like gunicorn's default graceful_timeout.
+graceful = int(_env.get("GRACEFUL_TIMEOUT", "30"))
+sys.stdout.write(f"Starting server on 0.0.0.0:{port} (RAILWAY_PORT={_railway_port}, PORT={_env_port})\n")
+sys.stdout.flush()
+
+# Multi-worker deploys: hand off to gunicorn so the master imports the app
+# once (--preload) and forked workers share it copy-on-write. Importing
+# api.server opens no connections: Storage, MCP sessions, the x402
+# facilitator handshake and the orchestrator thread all start in the FastAPI
+# lifespan, i.e. in each worker after fork. Only one worker (the holder of
+# the orchestrator lock) runs the agents; the rest pick up its results
+# from storage.
+if workers > 1 and not reload:
+    os.execvp("gunicorn", [
+        "gunicorn",
+        "-k", "uvicorn.workers.UvicornWorker",
+        "-w", str(workers),
+        "--preload",
+        "--graceful-timeout", str(graceful),
+        "-b", f"0.0.0.0:{port}",
+        *(["--access-logfile", "-"] if access_log else []),
+        "api.server:app",
+    ])
+
+# Heavy import deferred until the port is resolved and we're about to serve.
+import uvicorn  # noqa: E402
+
+if reload:
+    # Reload mode re-imports the app in a subprocess, so it needs the import string.
+    # The reloader supervisor never imports api.server, so it keeps uvicorn's
+    # default logging config.
+    uvicorn.run("api.server:app", host="0.0.0.0", port=port, reload=True, loop=loop, http=http,
+                access_log=access_log, timeout_graceful_shutdown=graceful)
+else:
+    # Bind before importing the app: connections queue in the listen backlog
+    # while api.server imports, instead of being refused. Importing here (not
+    # inside uvicorn's startup) also means sys.modules is fully warm before
+    # the event loop and signal handlers are set up.
+    sock = _bind_socket(port)
+    from api.server import app
 
-port = _resolve_port()
-print(f"Starting server on 0.0.0.0:{port} (RAILWAY_PORT={os.getenv('RAILWAY_PORT')}, PORT={os.getenv('PORT')})")
-uvicorn.run("api.server:app", host="0.0.0.0", port=port, reload=False)
+    _prewarm_imports()
+    config = uvicorn.Config(app, loop=loop, http=http, access_log=access_log, log_config=None,
+                            timeout_graceful_shutdown=graceful)
+    uvicorn.Server(config).run(sockets=[sock])
@@ -5,6 +5,19 @@ Serves a full single-page dashboard at /dashboard that visualizes
 all signal data, agent health, and portfolio insights.
 """
 
+from __future__ import annotations
+
+import gzip
+import hashlib
+import re
+import zlib
+from typing import Dict, Tuple
+
+try:
+    import brotli
+except ImportError:  # optional — gzip-only when brotli isn't installed
+    brotli = None
+
 DASHBOARD_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -69,7 +82,7 @@ DASHBOARD_HTML = """<!DOCTYPE html>
   .refresh-btn {
     background: var(--surface2); border: 1px solid var(--border);
     color: var(--text); padding: 6px 14px; border-radius: 6px;
-    cursor: pointer; font-size: 13px; transition: all 0.2s;
+    cursor: pointer; font-size: 13px; transition: border-color 0.2s, color 0.2s;
   }
   .refresh-btn:hover { border-color: var(--cyan); color: var(--cyan); }
 
@@ -88,6 +101,7 @@ DASHBOARD_HTML = """<!DOCTYPE html>
     border: 1px solid var(--border);
     border-radius: 10px;
     padding: 16px 20px;
+    contain: layout paint style;
   }
   .portfolio-card .label { font-size: 11px; text-transform: uppercase; letter-spacing: 1px; color: var(--text-dim); margin-bottom: 6px; }
   .portfolio-card .value { font-size: 22px; font-weight: 700; }
@@ -106,6 +120,7 @@ DASHBOARD_HTML = """<!DOCTYPE html>
     background: var(--surface); border: 1px solid var(--border);
     border-radius: 8px; padding: 8px 14px; white-space: nowrap;
     font-size: 13px; flex-shrink: 0;
+    contain: layout paint style;
   }
   .agent-chip .dot {
     width: 6px; height: 6px; border-radius: 50%;
@@ -141,7 +156,7 @@ DASHBOARD_HTML = """<!DOCTYPE html>
     padding: 10px 20px; cursor: pointer; border: none;
     background: none; color: var(--text-dim); font-size: 14px;
     font-weight: 500; border-bottom: 2px solid transparent;
-    transition: all 0.2s;
+    transition: color 0.2s, border-bottom-color 0.2s;
   }
   .tab:hover { color: var(--text); }
   .tab.active { color: var(--cyan); border-bottom-color: var(--cyan); }
@@ -179,12 +194,20 @@ DASHBOARD_HTML = """<!DOCTYPE html>
   .history-table tr:last-child td { border-bottom: none; }
   .history-table tr:hover { background: var(--surface2); }
   .history-table tr { cursor: pointer; transition: background 0.15s; }
+  /* Windowed tables (history runs, signal table) */
+  .vscroll { max-height: 75vh; overflow-y: auto; border-radius: 12px; }
+  .vscroll thead th { position: sticky; top: 0; z-index: 1; }
+  .vscroll tr.vspacer td { padding: 0; border: none; }
 
   .run-status { display: inline-block; padding: 2px 8px; border-radius: 4px; font-size: 11px; font-weight: 600; }
   .run-status.ok { background: var(--green-bg); color: var(--green); }
   .run-status.partial { background: var(--yellow-bg); color: var(--yellow); }
   .run-status.error { background: var(--red-bg); color: var(--red); }
 
+  .history-table td.arrow { color: var(--text-dim); }
+  tr[aria-expanded="false"] td.arrow::before { content: '▶'; }
+  tr[aria-expanded="true"] td.arrow::before { content: '▼'; }
+
   .expand-row { display: none; }
   .expand-row.open { display: table-row; }
   .expand-row td {
@@ -197,6 +220,7 @@ DASHBOARD_HTML = """<!DOCTYPE html>
   .expand-asset {
     background: var(--surface); border: 1px solid var(--border);
     border-radius: 8px; padding: 10px 14px;
+    contain: layout paint style;
   }
   .expand-asset .ea-name { font-weight: 700; font-size: 14px; margin-bottom: 4px; }
   .expand-asset .ea-score { font-size: 20px; font-weight: 800; }
@@ -217,9 +241,15 @@ DASHBOARD_HTML = """<!DOCTYPE html>
     border-radius: 10px;
     padding: 16px 20px;
     cursor: pointer;
-    transition: all 0.2s;
+    /* Only what :hover changes; "all" would also animate every class-driven
+       change on a refreshed card. */
+    transition: border-color 0.2s, transform 0.2s, box-shadow 0.2s;
     position: relative;
     overflow: hidden;
+    /* Off-screen cards skip style/layout/paint; "auto" keeps the last
+       measured size so the scrollbar doesn't jump as cards come into view. */
+    content-visibility: auto;
+    contain-intrinsic-size: auto 240px;
   }
   .signal-card:hover {
     border-color: var(--cyan);
@@ -315,6 +345,7 @@ DASHBOARD_HTML = """<!DOCTYPE html>
 
   /* Dimension bars */
   .dimensions { padding-left: 8px; }
+  .dimensions.pending { min-height: 126px; } /* 6 rows, reserved until hydrated */
   .dim-row {
     display: flex; align-items: center; gap: 8px;
     margin-bottom: 6px; font-size: 12px;
@@ -324,10 +355,10 @@ DASHBOARD_HTML = """<!DOCTYPE html>
     flex: 1; height: 6px; background: var(--surface2);
     border-radius: 3px; overflow: hidden;
   }
-  .dim-row .dim-bar {
-    height: 100%; border-radius: 3px;
-    transition: width 0.6s ease;
-  }
+  /* No width transition: bars are always inserted with their final width
+     (patchCard swaps a card's whole bar block, it never edits a width), so a
+     transition could not run and refreshes start no animations. */
+  .dim-row .dim-bar { height: 100%; border-radius: 3px; }
   .dim-row .dim-bar.high { background: var(--green); }
   .dim-row .dim-bar.mid { background: var(--yellow); }
   .dim-row .dim-bar.low { background: var(--red); }
@@ -366,6 +397,9 @@ DASHBOARD_HTML = """<!DOCTYPE html>
     padding: 4px 12px; border-radius: 6px;
     font-size: 12px; font-weight: 600;
   }
+  .dim-badge.cell-up { background: var(--green-bg); }
+  .dim-badge.cell-flat { background: var(--yellow-bg); }
+  .dim-badge.cell-down { background: var(--red-bg); }
   .modal-insight {
     background: var(--surface2); border-radius: 10px;
     padding: 16px 20px; margin-top: 16px; font-size: 13px;
@@ -394,6 +428,12 @@ DASHBOARD_HTML = """<!DOCTYPE html>
 
   .table-score { font-weight: 700; font-size: 15px; }
 
+  /* Score/direction colors shared by table cells, badges and modal */
+  .cell-up { color: var(--green); }
+  .cell-down { color: var(--red); }
+  .cell-flat { color: var(--yellow); }
+  .cell-dim { color: var(--text-dim); }
+
   /* Loading */
   .loading {
     display: flex; justify-content: center; align-items: center;
@@ -405,6 +445,13 @@ DASHBOARD_HTML = """<!DOCTYPE html>
     animation: spin 0.8s linear infinite;
   }
   @keyframes spin { to { transform: rotate(360deg); } }
+  /* First load: after 5s without data, swap to the slow-start message. */
+  .loading .msg { color: var(--text-dim); overflow: hidden; }
+  .loading .msg-slow { max-height: 0; opacity: 0; }
+  .loading.waiting .msg-fast { animation: msg-hide 0s 5s forwards; }
+  .loading.waiting .msg-slow { animation: msg-show 0s 5s forwards; }
+  @keyframes msg-hide { to { max-height: 0; opacity: 0; } }
+  @keyframes msg-show { to { max-height: 4em; opacity: 1; } }
 
   /* Responsive */
   @media (max-width: 768px) {
@@ -607,6 +654,10 @@ DASHBOARD_HTML = """<!DOCTYPE html>
   .daily-bar-count {
     font-size: 10px; color: var(--text-dim); margin-bottom: 4px;
   }
+  /* Canvas variant: bars drawn by the worker, one label slot per day */
+  .daily-canvas { display: block; width: 100%; height: 120px; }
+  .daily-labels { display: flex; }
+  .daily-labels > span { flex: 1; display: flex; justify-content: center; }
 
   .endpoint-table {
     width: 100%; border-collapse: collapse;
@@ -709,7 +760,7 @@ DASHBOARD_HTML = """<!DOCTYPE html>
 
   <!-- Content -->
   <div id="content">
-    <div class="loading"><div class="spinner"></div><span style="color:var(--text-dim)">Loading signals...</span></div>
+    <div class="loading waiting"><div class="spinner"></div><span class="msg msg-fast">Loading signals...</span><span class="msg msg-slow">Agents are computing signals... this can take up to 60s on first load.</span></div>
   </div>
 </div>
 
@@ -729,92 +780,317 @@ let sortDir = -1; // descending
 
 const API_BASE = '';
 
-async function fetchAll() {
-  const content = document.getElementById('content');
+// Long-lived elements, looked up once (the script runs after the markup).
+const contentEl = document.getElementById('content');
+const modalEl = document.getElementById('modal');
+const overlayEl = document.getElementById('modalOverlay');
+const statusDotEl = document.getElementById('statusDot');
+const lastUpdateEl = document.getElementById('lastUpdate');
+const portfolioBarEl = document.getElementById('portfolioBar');
+const agentsStripEl = document.getElementById('agentsStrip');
+const insightBannerEl = document.getElementById('insightBanner');
+
+// Coalesce DOM writes into one animation frame so a refresh costs a single
+// style/layout pass instead of one per renderer. Background updates (the
+// auto-refresh, live pushes) pass `idle` and wait for an idle period (at
+// most 200ms) so they don't land in the middle of scrolling or typing.
+function scheduleRender(fn, idle) {
+  const q = scheduleRender._q || (scheduleRender._q = []);
+  if (!q.includes(fn)) q.push(fn);
+  if (idle && window.requestIdleCallback) {
+    scheduleRender._idle ||= requestIdleCallback(flushRenders, { timeout: 200 });
+  } else {
+    scheduleRender._raf ||= requestAnimationFrame(flushRenders);
+  }
+}
 
-  // Show loading state with timeout feedback
-  let loadTimer = setTimeout(() => {
-    content.innerHTML = '<div class="loading"><div class="spinner"></div><span style="color:var(--text-dim)">Agents are computing signals... this can take up to 60s on first load.</span></div>';
-  }, 5000);
+function flushRenders() {
+  if (scheduleRender._idle) cancelIdleCallback(scheduleRender._idle);
+  if (scheduleRender._raf) cancelAnimationFrame(scheduleRender._raf);
+  const q = scheduleRender._q || [];
+  scheduleRender._q = scheduleRender._idle = scheduleRender._raf = null;
+  for (const f of q) f();
+}
 
-  try {
-    // Fetch health first (always fast), then signal (may be slow on first load)
-    const healthRes = await fetch(API_BASE + '/health');
-    healthData = await healthRes.json();
-    renderAgents();
+// Replace the view in #content with one write: the markup is parsed into a
+// detached fragment (in #content's context) and swapped in whole, so the live
+// tree sees a single mutation and one style/layout pass.
+function setContent(html) {
+  contentEl.replaceChildren(parseContent(html));
+}
 
-    const sigRes = await fetch(API_BASE + '/api/signal');
-    clearTimeout(loadTimer);
+// Markup parsed into a detached fragment in #content's context.
+function parseContent(html) {
+  const range = document.createRange();
+  range.selectNodeContents(contentEl);
+  return range.createContextualFragment(html);
+}
 
-    if (!sigRes.ok) {
-      throw new Error(`Signal API returned ${sigRes.status}`);
-    }
+// One click listener for every card and row in #content: signal cards and
+// table rows carry data-asset (opens the modal), history runs data-expand,
+// and sortable table headers data-sort.
+contentEl.addEventListener('click', e => {
+  const el = e.target.closest('[data-asset], tr[data-expand], th[data-sort]');
+  if (!el) return;
+  if (el.dataset.asset) openModal(el.dataset.asset);
+  else if (el.dataset.sort) setSort(el.dataset.sort);
+  else toggleExpand(el);
+});
 
-    signalData = await sigRes.json();
+// Large payloads (/api/bootstrap, /analytics) are fetched and parsed in a worker
+// so JSON.parse doesn't block input on the main thread. Messages posted while
+// its script is still loading are queued by the browser, so the worker is
+// used from the first fetch. If it can't start, or dies, requests fall back
+// to plain fetch and replies it still owed are failed rather than left hanging.
+const JSON_WORKER_URL = '__JSON_WORKER_URL__';
+const workerPending = new Set();
+let jsonWorker = null;
+try {
+  jsonWorker = new Worker(JSON_WORKER_URL);
+  jsonWorker.onerror = () => {
+    jsonWorker = null;
+    for (const fail of workerPending) fail();
+    workerPending.clear();
+  };
+} catch (e) { /* no worker support: main-thread fetch */ }
+
+// One request/reply with the worker over its own MessageChannel.
+function workerRequest(msg) {
+  return new Promise((resolve, reject) => {
+    const ch = new MessageChannel();
+    const fail = () => { ch.port1.close(); reject(new Error('JSON worker stopped')); };
+    workerPending.add(fail);
+    ch.port1.onmessage = e => {
+      workerPending.delete(fail);
+      ch.port1.close();
+      e.data.error ? reject(new Error(e.data.error)) : resolve(e.data);
+    };
+    jsonWorker.postMessage(msg, [ch.port2]);
+  });
+}
 
-    document.getElementById('statusDot').className = 'status-dot';
-    document.getElementById('lastUpdate').textContent =
-      'Updated: ' + new Date(signalData.timestamp || Date.now()).toLocaleTimeString();
+// Resolves { ok, status, data } either way. A body identical to the last one
+// seen for the same URL resolves { ok, status, unchanged: true } instead, so
+// an idle refresh skips the parse and every render downstream of it.
+const lastBodies = new Map();
 
-    // Fetch performance data (non-blocking)
-    try {
-      const perfRes = await fetch(API_BASE + '/api/performance/reputation');
-      perfData = await perfRes.json();
-    } catch(e) { perfData = null; }
+// JSON.parse in the worker when there is one.
+function parseJSON(text) {
+  if (!jsonWorker) return Promise.resolve(JSON.parse(text));
+  return workerRequest({ parse: text }).then(r => r.data);
+}
 
-    // Fetch analytics data (non-blocking) — days=3650 ≈ all-time
-    try {
-      const analyticsRes = await fetch(API_BASE + '/analytics?days=3650');
-      analyticsData = await analyticsRes.json();
-    } catch(e) { analyticsData = null; }
+function fetchJSON(path) {
+  const url = API_BASE + path;
+  if (!jsonWorker) {
+    return fetch(url).then(async r => {
+      if (!r.ok) return { ok: false, status: r.status, data: null };
+      const text = await r.text();
+      if (lastBodies.get(url) === text) return { ok: true, status: r.status, unchanged: true };
+      lastBodies.set(url, text);
+      return { ok: true, status: r.status, data: JSON.parse(text) };
+    });
+  }
+  return workerRequest({ url: new URL(url, location.href).href });
+}
 
-    try {
-      const errRes = await fetch(API_BASE + '/analytics/errors?days=3650');
-      window._errorData = await errRes.json();
-    } catch(e) { window._errorData = null; }
+function markUpdated() {
+  statusDotEl.className = 'status-dot';
+  lastUpdateEl.textContent =
+    'Updated: ' + TIME_FMT.format(new Date(signalData.timestamp || Date.now()));
+}
 
-    // Fetch agent intelligence data (non-blocking) — days=3650 ≈ all-time
-    try {
-      const agentsRes = await fetch(API_BASE + '/analytics/agents?days=3650');
-      window._agentsData = await agentsRes.json();
-    } catch(e) { window._agentsData = null; }
+// Live signal push: the server sends a snapshot on connect (unless we already
+// hold the current one) and per-asset deltas after each fusion run. The full
+// snapshot is parsed in the JSON worker; events are applied strictly in
+// arrival order, so a delta never lands before the snapshot it follows.
+let signalStream = null;
+let signalStreamChain = Promise.resolve();
+
+function onStreamEvent(apply) {
+  return e => {
+    signalStreamChain = signalStreamChain
+      .then(() => apply(e.data))
+      .then(() => { indexSignals(); onSignalPush(); })
+      .catch(err => console.error('Signal stream:', err));
+  };
+}
 
-    // Fetch pipeline health data (non-blocking) — days=3650 ≈ all-time
-    try {
-      const pipeRes = await fetch(API_BASE + '/analytics/pipeline-health?days=3650');
-      window._pipelineData = await pipeRes.json();
-    } catch(e) { window._pipelineData = null; }
+function connectSignalStream() {
+  if (signalStream || !window.EventSource) return;
+  const since = signalData?.timestamp ? '?since=' + encodeURIComponent(signalData.timestamp) : '';
+  signalStream = new EventSource(API_BASE + '/api/signal/stream' + since);
+  signalStream.addEventListener('snapshot', onStreamEvent(async text => {
+    signalData = await parseJSON(text);
+  }));
+  signalStream.addEventListener('delta', onStreamEvent(text => {
+    applySignalDelta(JSON.parse(text));
+  }));
+}
 
-    // Fetch x402 diagnostics (non-blocking) — days=3650 ≈ all-time
-    try {
-      const x402Res = await fetch(API_BASE + '/analytics/x402/diagnostics?days=3650');
-      window._x402Diag = await x402Res.json();
-    } catch(e) { window._x402Diag = null; }
-
-    renderPortfolio();
-    renderInsight();
-    if (currentView === 'history') {
-      loadHistory();
-    } else if (currentView === 'performance') {
-      renderPerformance();
-    } else if (currentView === 'analytics') {
-      renderAnalytics();
+// Builds the next snapshot rather than editing the current one: panels and
+// caches treat a same-reference payload as unchanged.
+function applySignalDelta(d) {
+  if (!signalData) return;
+  const data = signalData.data || {};
+  const signals = { ...data.signals, ...d.signals };
+  for (const asset of d.removed) delete signals[asset];
+  signalData = { ...signalData, timestamp: d.timestamp, data: { ...data, ...d.data, signals } };
+}
+
+let signalPushes = 0; // stream updates so far; the refresh backoff reads it
+
+function onSignalPush() {
+  signalPushes++;
+  markUpdated();
+  dataChanged(new Set(['signal']), true);
+  scheduleRender(saveBootSnapshot, true);
+}
+
+function renderCurrentView() {
+  if (currentView === 'history') {
+    loadHistory();
+  } else if (currentView === 'performance') {
+    renderPerformance();
+  } else if (currentView === 'analytics') {
+    renderAnalytics();
+  } else if (currentView === 'signal-health') {
+    loadSignalHealth();
+  } else {
+    renderSignals();
+  }
+}
+
+// The last snapshot is kept for the session, so a reload or a return visit
+// paints straight away while fetchAll revalidates. Index expandos are
+// rebuilt on restore rather than stored.
+const BOOT_KEY = 'w3boot';
+const SNAPSHOT_EXPANDOS = new Set(['_flat', '_byAsset', '_sorted', '_cols']);
+
+function saveBootSnapshot() {
+  try {
+    sessionStorage.setItem(BOOT_KEY, JSON.stringify(
+      { signal: signalData, health: healthData },
+      (k, v) => SNAPSHOT_EXPANDOS.has(k) ? undefined : v,
+    ));
+  } catch (e) { /* storage full or disabled */ }
+}
+
+function restoreBootSnapshot() {
+  let boot = null;
+  try { boot = JSON.parse(sessionStorage.getItem(BOOT_KEY)); } catch (e) { return; }
+  if (!boot?.signal) return;
+  signalData = boot.signal;
+  healthData = boot.health;
+  indexSignals();
+  markUpdated();
+  renderAgents();
+  renderPortfolio();
+  renderInsight();
+  renderSignals();
+}
+
+const LOADING_HTML = '<div class="loading waiting"><div class="spinner"></div><span class="msg msg-fast">Loading signals...</span><span class="msg msg-slow">Agents are computing signals... this can take up to 60s on first load.</span></div>';
+
+// `background` is set by the auto-refresh: its renders wait for idle time.
+// Resolves with the sources whose payload changed (undefined on failure).
+let fetchFailed = false;
+
+async function fetchAll(background = false) {
+
+  // Until the first signal lands, show the loading state; its slow-start
+  // message is timed in CSS, so refreshes schedule no timer.
+  if (!signalData && !contentEl.querySelector('.loading.waiting')) {
+    contentEl.innerHTML = LOADING_HTML;
+  }
+
+  // Fire every request at once so a refresh waits max(RTT), not sum(RTT).
+  // Signal and health share one round trip; while the live stream is open,
+  // signal updates arrive by push and the poll only needs health.
+  const streamLive = signalStream?.readyState === 1 && signalData;
+  const coreP = fetchJSON(streamLive ? '/health' : '/api/bootstrap');
+  // Secondary panels (non-blocking) — days=3650 ≈ all-time
+  const extrasP = Promise.allSettled([
+    fetchJSON('/api/performance/reputation'),
+    fetchJSON('/analytics?days=3650'),
+    fetchJSON('/analytics/errors?days=3650'),
+    fetchJSON('/analytics/agents?days=3650'),
+    fetchJSON('/analytics/pipeline-health?days=3650'),
+    fetchJSON('/analytics/x402/diagnostics?days=3650'),
+  ]);
+
+  try {
+    const core = await coreP;
+
+    // After a failed refresh the error screen is up, so redraw regardless.
+    const recovering = fetchFailed;
+    fetchFailed = false;
+    const touched = new Set(); // sources (see VIEW_SOURCES) whose payload changed
+    if (streamLive) {
+      if (!core.unchanged) {
+        healthData = core.data;
+        touched.add('health');
+        scheduleRender(renderAgents, background);
+      }
     } else {
-      renderSignals();
+      if (!core.ok) {
+        throw new Error(`Signal API returned ${core.status}`);
+      }
+      if (!core.unchanged) {
+        const { signal, health } = core.data;
+        healthData = health;
+        touched.add('health');
+        scheduleRender(renderAgents, background);
+        // A health-only change leaves the indexed snapshot (and its caches) be.
+        if (!signalData || signal.timestamp !== signalData.timestamp) {
+          signalData = signal;
+          indexSignals();
+          touched.add('signal');
+        }
+        scheduleRender(saveBootSnapshot, true);
+      }
+      markUpdated();
     }
+
+    const extras = (await extrasP).map(r => r.status === 'fulfilled' ? r.value : null);
+    // Each payload keeps its previous object when the body is unchanged, so
+    // a new reference marks its source as touched.
+    const pick = (r, prev, source) => {
+      const v = r ? (r.unchanged ? prev : r.data) : null;
+      if (v !== prev) touched.add(source);
+      return v;
+    };
+    const [perfR, analyticsR, errR, agentsR, pipeR, x402R] = extras;
+    perfData = pick(perfR, perfData, 'perf');
+    analyticsData = pick(analyticsR, analyticsData, 'analytics');
+    window._errorData = pick(errR, window._errorData, 'analytics');
+    window._agentsData = pick(agentsR, window._agentsData, 'analytics');
+    window._pipelineData = pick(pipeR, window._pipelineData, 'pipeline');
+    window._x402Diag = pick(x402R, window._x402Diag, 'analytics');
+
+    connectSignalStream();
+    dataChanged(touched, background, recovering);
+    return touched;
   } catch (e) {
-    clearTimeout(loadTimer);
-    document.getElementById('statusDot').className = 'status-dot offline';
-    document.getElementById('lastUpdate').textContent = 'Connection error';
-    content.innerHTML = `<div class="loading">
+    fetchFailed = true;
+    statusDotEl.className = 'status-dot offline';
+    lastUpdateEl.textContent = 'Connection error';
+    contentEl.innerHTML = `<div class="loading">
       <span style="color:var(--red);font-size:16px;">Failed to load signals</span>
-      <span style="color:var(--text-dim);font-size:13px;">${e.message || 'Network error'}</span>
+      <span style="color:var(--text-dim);font-size:13px;">${safeVal(e.message || 'Network error')}</span>
       <button class="refresh-btn" onclick="fetchAll()" style="margin-top:12px;">Try Again</button>
     </div>`;
     console.error('Fetch failed:', e);
   }
 }
 
+// Input each header panel was last drawn from. Payloads are replaced (never
+// mutated) when they change, so a same-reference input means the panel is
+// already current and its innerHTML is left alone. The portfolio bar has no
+// single input (it also shows the agent count and the reputation card), so
+// it compares its markup instead.
+const renderedFrom = { agents: null, insight: null };
+
 function renderPortfolio() {
   const ps = signalData?.data?.portfolio_summary;
   if (!ps) return;
@@ -829,25 +1105,25 @@ function renderPortfolio() {
   const degrading = ps.assets_degrading || 0;
   const agents = signalData?.data?.meta?.agents_available?.length || 0;
 
-  document.getElementById('portfolioBar').innerHTML = `
+  const html = `
     <div class="portfolio-card">
       <div class="label">Market Regime</div>
-      <div class="value ${regimeClass}">${regime.replace(/_/g, ' ').toUpperCase()}</div>
-      <div class="sub">Risk: ${risk}</div>
+      <div class="value ${regimeClass}">${spaced(regime).toUpperCase()}</div>
+      <div class="sub">Risk: ${safeHtml(risk)}</div>
     </div>
     <div class="portfolio-card">
       <div class="label">Top Buy Signal</div>
-      <div class="value" style="color:var(--green)">${topBuy ? topBuy.asset : '—'}</div>
-      <div class="sub">${topBuy ? topBuy.score + ' — ' + topBuy.label : 'No data'}</div>
+      <div class="value" style="color:var(--green)">${topBuy ? safeHtml(topBuy.asset) : '—'}</div>
+      <div class="sub">${topBuy ? topBuy.score + ' — ' + safeHtml(String(topBuy.label)) : 'No data'}</div>
     </div>
     <div class="portfolio-card">
       <div class="label">Top Sell Signal</div>
-      <div class="value" style="color:var(--red)">${topSell ? topSell.asset : '—'}</div>
-      <div class="sub">${topSell ? topSell.score + ' — ' + topSell.label : 'No data'}</div>
+      <div class="value" style="color:var(--red)">${topSell ? safeHtml(topSell.asset) : '—'}</div>
+      <div class="sub">${topSell ? topSell.score + ' — ' + safeHtml(String(topSell.label)) : 'No data'}</div>
     </div>
     <div class="portfolio-card">
       <div class="label">Signal Momentum</div>
-      <div class="value neutral">${momentum.toUpperCase()}</div>
+      <div class="value neutral">${safeHtml(momentum.toUpperCase())}</div>
       <div class="sub">${improving} improving / ${degrading} degrading</div>
     </div>
     <div class="portfolio-card">
@@ -857,125 +1133,423 @@ function renderPortfolio() {
     </div>
     ${renderReputationCard()}
   `;
+  // Refreshes usually leave the summary unchanged — skip the reparse.
+  if (portfolioBarEl._html !== html) {
+    portfolioBarEl.innerHTML = html;
+    portfolioBarEl._html = html;
+  }
 }
 
+const AGENT_ORDER = Object.freeze(['whale_agent', 'technical_agent', 'derivatives_agent', 'narrative_agent', 'market_agent']);
+const AGENT_NAMES = Object.freeze({ whale_agent: 'Whale', technical_agent: 'Technical', derivatives_agent: 'Derivatives', narrative_agent: 'Narrative', market_agent: 'Market' });
+const AGENT_WEIGHTS = Object.freeze({ whale_agent: '30%', technical_agent: '25%', derivatives_agent: '20%', narrative_agent: '15%', market_agent: '10%' });
+
+// The chips are static markup built once; refreshes only patch the status
+// dot's class and the duration/status text.
+let agentChipRefs = null;
+
 function renderAgents() {
   const agents = healthData?.agents;
-  if (!agents) return;
+  if (!agents || agents === renderedFrom.agents) return;
+  renderedFrom.agents = agents;
 
-  const order = ['whale_agent', 'technical_agent', 'derivatives_agent', 'narrative_agent', 'market_agent'];
-  const names = { whale_agent: 'Whale', technical_agent: 'Technical', derivatives_agent: 'Derivatives', narrative_agent: 'Narrative', market_agent: 'Market' };
-  const weights = { whale_agent: '30%', technical_agent: '25%', derivatives_agent: '20%', narrative_agent: '15%', market_agent: '10%' };
-
-  document.getElementById('agentsStrip').innerHTML = order.map(key => {
+  if (!agentChipRefs) {
+    agentsStripEl.innerHTML = AGENT_ORDER.map(key => `
+      <div class="agent-chip">
+        <span class="dot"></span>
+        <span class="name">${AGENT_NAMES[key]}</span>
+        <span class="meta">${AGENT_WEIGHTS[key]}</span>
+        <span class="meta"></span>
+      </div>`).join('');
+    agentChipRefs = {};
+    agentsStripEl.querySelectorAll('.agent-chip').forEach((chip, i) => {
+      const metas = chip.querySelectorAll('.meta');
+      agentChipRefs[AGENT_ORDER[i]] = { dot: chip.querySelector('.dot'), meta: metas[1] };
+    });
+  }
+
+  for (const key of AGENT_ORDER) {
     const a = agents[key] || {};
     const status = a.status || 'no_data';
     const dotClass = status === 'ok' || status === 'partial' ? 'ok' : status === 'no_data' ? 'warn' : 'err';
-    const lastRun = a.last_run ? new Date(a.last_run).toLocaleTimeString() : 'never';
     const dur = a.duration_ms ? (a.duration_ms / 1000).toFixed(1) + 's' : '';
-    return `
-      <div class="agent-chip">
-        <span class="dot ${dotClass}"></span>
-        <span class="name">${names[key]}</span>
-        <span class="meta">${weights[key]}</span>
-        <span class="meta">${dur || status}</span>
-      </div>`;
-  }).join('');
+    const ref = agentChipRefs[key];
+    ref.dot.className = 'dot ' + dotClass;
+    ref.meta.textContent = dur || status;
+  }
 }
 
 function renderInsight() {
   const insight = signalData?.data?.portfolio_summary?.llm_insight;
-  const banner = document.getElementById('insightBanner');
-  if (!insight) { banner.style.display = 'none'; return; }
-  banner.style.display = 'block';
-  banner.innerHTML = `
+  if (insight === renderedFrom.insight) return;
+  renderedFrom.insight = insight;
+  if (!insight) { insightBannerEl.style.display = 'none'; return; }
+  insightBannerEl.style.display = 'block';
+  insightBannerEl.innerHTML = `
     <div class="insight-label">AI Portfolio Insight</div>
     <div>${formatMarkdown(insight)}</div>
   `;
 }
 
+// One compiled regex, one pass: **bold**, newlines, and HTML-escaping of the
+// (LLM-generated) text itself.
+const MD_RE = /\\*\\*(.*?)\\*\\*|\\n|[&<>"]/g;
+// Plain one-line text has nothing for MD_RE to do.
+const MD_ANY_RE = /[*\\n&<>"]/;
+const HTML_ESC = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;' };
+const escapeHtml = (text) => text.replace(/[&<>"]/g, c => HTML_ESC[c]);
+
+// escapeHtml behind a scan: asset names and labels almost never contain a
+// markup character, so they come back as-is without a regex replace.
+function safeHtml(text) {
+  for (let i = 0; i < text.length; i++) {
+    const c = text.charCodeAt(i);
+    if (c === 38 || c === 60 || c === 62 || c === 34) return escapeHtml(text);
+  }
+  return text;
+}
+
+// safeHtml for payload fields that are not guaranteed to be strings.
+const safeVal = (v) => safeHtml(String(v));
+
+// Insights change once per fusion cycle but are re-formatted on every modal
+// open, so results are memoized (oldest evicted past 32 entries).
+const markdownCache = new Map();
+
 function formatMarkdown(text) {
-  return text
-    .replace(/\\*\\*(.*?)\\*\\*/g, '<strong>$1</strong>')
-    .replace(/\\n/g, '<br>');
+  if (!MD_ANY_RE.test(text)) return text;
+  let html = markdownCache.get(text);
+  if (html === undefined) {
+    html = text.replace(MD_RE, (m, bold) =>
+      bold !== undefined ? '<strong>' + escapeHtml(bold) + '</strong>'
+        : m === '\\n' ? '<br>'
+        : HTML_ESC[m]);
+    markdownCache.set(text, html);
+    if (markdownCache.size > 32) markdownCache.delete(markdownCache.keys().next().value);
+  }
+  return html;
+}
+
+// Display forms of the small, repeating vocabularies (regimes, client and
+// error types, signal labels), computed once per distinct value.
+const spacedCache = new Map();
+const labelClassCache = new Map();
+
+function spaced(text) { // 'mcp_client' -> 'mcp client', HTML-safe
+  let v = spacedCache.get(text);
+  if (v === undefined) spacedCache.set(text, v = safeHtml(text.replace(/_/g, ' ')));
+  return v;
+}
+
+function labelClassOf(label) { // 'STRONG BUY' -> 'strong-buy'
+  let v = labelClassCache.get(label);
+  if (v === undefined) labelClassCache.set(label, v = safeHtml(label.toLowerCase().replace(/ /g, '-')));
+  return v;
+}
+
+// Timestamps formatted like toLocaleString(), with the locale resolved once.
+// Panels repaint the same timestamps on every refresh, so the strings are
+// cached; loading a history page starts the cache over.
+const DATE_TIME_FMT = new Intl.DateTimeFormat(undefined, {
+  year: 'numeric', month: 'numeric', day: 'numeric',
+  hour: 'numeric', minute: '2-digit', second: '2-digit',
+});
+const dateTimeCache = new Map();
+// Same idea for the toLocaleTimeString()/toLocaleDateString() call sites.
+const TIME_FMT = new Intl.DateTimeFormat(undefined, { hour: 'numeric', minute: '2-digit', second: '2-digit' });
+const DATE_FMT = new Intl.DateTimeFormat(undefined, { year: 'numeric', month: 'numeric', day: 'numeric' });
+const HOUR_MINUTE_FMT = new Intl.DateTimeFormat(undefined, { hour: '2-digit', minute: '2-digit' });
+const INT_FMT = new Intl.NumberFormat();
+const fmtInt = v => INT_FMT.format(v);
+
+function fmtDateTime(ts) {
+  let v = dateTimeCache.get(ts);
+  if (v === undefined) dateTimeCache.set(ts, v = DATE_TIME_FMT.format(new Date(ts)));
+  return v;
+}
+
+// Composite scores as toFixed(1). Whole numbers skip the number formatter and
+// fractional ones are cached, since the same scores repaint on every refresh.
+const fmt1Cache = new Map();
+
+function fmt1(v) {
+  if (Number.isInteger(v)) return v + '.0';
+  let r = fmt1Cache.get(v);
+  if (r === undefined) {
+    if (fmt1Cache.size >= 256) fmt1Cache.clear();
+    fmt1Cache.set(v, r = v.toFixed(1));
+  }
+  return r;
+}
+
+const DIMENSIONS = ['whale', 'technical', 'derivatives', 'narrative', 'market', 'trend'];
+
+// Numeric sort columns, one Float64Array per field indexed like `_flat`.
+// Asset names compare by code point, like the server's sorted_views.
+const SORT_COLUMNS = Object.freeze(['score', ...DIMENSIONS]);
+const byAssetName = (a, b) => (a.asset < b.asset ? -1 : a.asset > b.asset ? 1 : 0);
+
+// Flatten the snapshot once per update: one object per asset shared by every
+// sort, tab switch and render, plus its sort keys laid out column-wise in
+// `_cols`. `_sorted` memoizes each (field, dir) order until the next update;
+// `_asset` / `_label` hold the HTML-safe name and label for the renderers and
+// `_labelClass` the label's CSS class.
+function indexSignals() {
+  const signals = signalData?.data?.signals || {};
+  const flat = [];
+  const byAsset = new Map();
+  for (const asset in signals) {
+    const s = signals[asset];
+    const item = {
+      asset, ...s,
+      _asset: safeHtml(asset),
+      _label: safeHtml(s.label || 'N/A'),
+      _labelClass: labelClassOf(s.label || ''),
+    };
+    flat.push(item);
+    byAsset.set(asset, item);
+  }
+  const n = flat.length;
+  const cols = {};
+  for (const f of SORT_COLUMNS) cols[f] = new Float64Array(n);
+  for (let i = 0; i < n; i++) {
+    const s = flat[i];
+    const dims = s.dimensions || {};
+    cols.score[i] = s.composite_score || 0;
+    for (const d of DIMENSIONS) cols[d][i] = dims[d]?.score || 0;
+  }
+  signalData._flat = flat;
+  signalData._cols = cols;
+  signalData._byAsset = byAsset;
+  signalData._sorted = new Map();
 }
 
 function getSignalList() {
-  const signals = signalData?.data?.signals;
-  if (!signals) return [];
-  return Object.entries(signals).map(([asset, s]) => ({ asset, ...s }));
+  return signalData?._flat || [];
+}
+
+function sortedSignalList(field, dir) {
+  if (!signalData?._sorted) return [];
+  const key = field + (dir < 0 ? '_desc' : '_asc');
+  let list = signalData._sorted.get(key);
+  if (list) return list;
+
+  // The server ships every sort order precomputed; fall back to sorting here
+  // only if the payload lacks it.
+  const byAsset = signalData._byAsset;
+  const order = signalData.data?.sorted_views?.[key];
+  if (order) {
+    list = order.map(a => byAsset.get(a)).filter(Boolean);
+  } else if (field === 'asset') {
+    // Swap operands (not reverse()) for descending so ties keep payload order.
+    list = getSignalList().slice().sort(dir < 0 ? (a, b) => byAssetName(b, a) : byAssetName);
+  } else {
+    // Sort row indices over the flat column; the sort is stable, so ties keep
+    // payload order in both directions.
+    const col = signalData._cols[field] || signalData._cols.score;
+    const flat = getSignalList();
+    const idx = Uint32Array.from(flat.keys());
+    idx.sort(dir < 0 ? (i, j) => col[j] - col[i] : (i, j) => col[i] - col[j]);
+    list = Array.from(idx, i => flat[i]);
+  }
+  signalData._sorted.set(key, list);
+  return list;
 }
 
 function renderSignals() {
-  const list = getSignalList();
+  const list = sortedSignalList(sortField, sortDir);
   if (!list.length) {
-    document.getElementById('content').innerHTML = '<div class="loading"><span style="color:var(--text-dim)">No signal data</span></div>';
+    contentEl.innerHTML = '<div class="loading"><span style="color:var(--text-dim)">No signal data</span></div>';
     return;
   }
 
-  // Sort
-  list.sort((a, b) => {
-    let va, vb;
-    if (sortField === 'asset') { va = a.asset; vb = b.asset; return sortDir * va.localeCompare(vb); }
-    if (sortField === 'score') { va = a.composite_score || 0; vb = b.composite_score || 0; }
-    else if (sortField === 'whale') { va = a.dimensions?.whale?.score || 0; vb = b.dimensions?.whale?.score || 0; }
-    else if (sortField === 'technical') { va = a.dimensions?.technical?.score || 0; vb = b.dimensions?.technical?.score || 0; }
-    else if (sortField === 'derivatives') { va = a.dimensions?.derivatives?.score || 0; vb = b.dimensions?.derivatives?.score || 0; }
-    else if (sortField === 'narrative') { va = a.dimensions?.narrative?.score || 0; vb = b.dimensions?.narrative?.score || 0; }
-    else if (sortField === 'market') { va = a.dimensions?.market?.score || 0; vb = b.dimensions?.market?.score || 0; }
-    else if (sortField === 'trend') { va = a.dimensions?.trend?.score || 0; vb = b.dimensions?.trend?.score || 0; }
-    else { va = a.composite_score || 0; vb = b.composite_score || 0; }
-    return sortDir * (va - vb);
-  });
-
   if (currentView === 'grid') renderGrid(list);
   else renderTable(list);
 }
 
+// Keyed card reconciliation: cards are kept per asset across refreshes and
+// only rebuilt when their markup changes; unchanged cards are just reordered.
+const cardNodes = new Map();
+let gridEl = null;
+
+// Cards past the first CARD_EAGER are inserted without their dimension bars;
+// the bars are filled in when the card nears the viewport.
+const CARD_EAGER = 8;
+const cardObserver = window.IntersectionObserver
+  ? new IntersectionObserver(entries => {
+      for (const e of entries) if (e.isIntersecting) hydrateCard(e.target);
+    }, { rootMargin: '200px' })
+  : null;
+
+function hydrateCard(node) {
+  cardObserver.unobserve(node);
+  const dims = node.querySelector('.dimensions');
+  dims.innerHTML = node._dims;
+  dims.classList.remove('pending');
+  node._dims = null;
+}
+
 function renderGrid(list) {
-  document.getElementById('content').innerHTML = `<div class="signal-grid">${
-    list.map(s => {
-      const dir = s.direction || 'neutral';
-      const labelClass = (s.label || '').toLowerCase().replace(/ /g, '-');
-      const dims = s.dimensions || {};
-      return `
-        <div class="signal-card" onclick="openModal('${s.asset}')">
-          <div class="score-stripe ${dir}"></div>
-          <div class="card-top">
-            <span class="asset">${s.asset}</span>
-            <span class="score ${dir}">${(s.composite_score || 0).toFixed(1)}</span>
-          </div>
-          <span class="card-label ${labelClass}">${s.label || 'N/A'}</span>
-          ${renderCardPrediction(s)}
-          <div class="dimensions">
-            ${renderDimBar('whale', dims.whale)}
-            ${renderDimBar('technical', dims.technical)}
-            ${renderDimBar('derivatives', dims.derivatives)}
-            ${renderDimBar('narrative', dims.narrative)}
-            ${renderDimBar('market', dims.market)}
-            ${renderDimBar('trend', dims.trend)}
-          </div>
-        </div>`;
-    }).join('')
-  }</div>`;
+  if (!gridEl || gridEl.parentNode !== contentEl) {
+    contentEl.innerHTML = '<div class="signal-grid"></div>';
+    gridEl = contentEl.firstChild;
+    cardNodes.clear();
+    if (cardObserver) cardObserver.disconnect();
+  }
+
+  // Pass 1: markup per card. Changed cards are patched in place; new ones
+  // are parsed together, so a refresh costs at most one template parse.
+  const cards = new Array(list.length);
+  const parts = [];
+  const fresh = [];
+  list.forEach((s, i) => {
+    const { dims, pred, html } = cardMarkup(s);
+    const node = cardNodes.get(s.asset);
+    const card = cards[i] = { s, dims, pred, html, node, lazy: false };
+    if (node) {
+      if (node._html !== html) patchCard(node, card);
+    } else {
+      // New cards below the fold wait for the observer to fill their bars.
+      card.lazy = !!cardObserver && i >= CARD_EAGER;
+      parts.push(card.lazy ? renderCard(s, null, pred) : html);
+      fresh.push(card);
+    }
+  });
+  if (fresh.length) {
+    const tpl = document.createElement('template');
+    tpl.innerHTML = parts.join('');
+    const els = tpl.content.children;
+    fresh.forEach((card, j) => {
+      const el = els[j];
+      el._html = card.html;
+      el._pred = card.pred;
+      el._dimsHtml = card.dims;
+      el._dims = card.lazy ? card.dims : null;
+      card.node = el;
+      cardNodes.set(card.s.asset, el);
+    });
+    for (const card of fresh) if (card.lazy) cardObserver.observe(card.node);
+  }
+
+  // Pass 2: put the nodes in list order, moving only the ones out of place.
+  const seen = new Set();
+  let prev = null;
+  for (const { s, node } of cards) {
+    seen.add(s.asset);
+    const want = prev ? prev.nextSibling : gridEl.firstChild;
+    if (node !== want) gridEl.insertBefore(node, want);
+    prev = node;
+  }
+  for (const [asset, node] of cardNodes) {
+    if (!seen.has(asset)) {
+      if (node._dims != null) cardObserver.unobserve(node);
+      node.remove();
+      cardNodes.delete(asset);
+    }
+  }
+}
+
+// `dims` is the renderCardDims() markup, or null for a lazy placeholder.
+// Card markup keyed by every field the card shows. Most assets move slowly,
+// so a refresh mostly hits here instead of rebuilding the template; the
+// oldest entries are evicted past 500.
+const cardMarkupCache = new Map();
+
+function cardMarkup(s) {
+  const dimsIn = s.dimensions || {};
+  let key = s.asset + '|' + s.composite_score + '|' + s.label + '|' + s.direction + '|'
+    + s.conviction + '|' + s.signal_strength + '|' + s.predicted_move?.expected_pct;
+  for (let i = 0; i < DIMENSIONS.length; i++) key += '|' + dimsIn[DIMENSIONS[i]]?.score;
+  let m = cardMarkupCache.get(key);
+  if (m === undefined) {
+    const dims = renderCardDims(s);
+    const pred = renderCardPrediction(s);
+    m = { dims, pred, html: renderCard(s, dims, pred) };
+    cardMarkupCache.set(key, m);
+    if (cardMarkupCache.size > 500) cardMarkupCache.delete(cardMarkupCache.keys().next().value);
+  }
+  return m;
+}
+
+// Updates a card that is already in the grid: score, direction and label are
+// written as properties, and the prediction and bar sections are swapped
+// only when their own markup changed. A card still waiting for hydration
+// just gets its pending bars replaced.
+function patchCard(node, { s, dims, pred, html }) {
+  const dir = s.direction || 'neutral';
+  const [stripe, top, label, predEl, dimsEl] = node.children;
+  stripe.className = 'score-stripe ' + dir;
+  top.lastElementChild.className = 'score ' + dir;
+  top.lastElementChild.textContent = fmt1(s.composite_score || 0);
+  label.className = 'card-label ' + s._labelClass;
+  label.textContent = s.label || 'N/A';
+  if (node._pred !== pred) {
+    predEl.replaceWith(parseContent(pred));
+    node._pred = pred;
+  }
+  if (node._dimsHtml !== dims) {
+    if (node._dims != null) node._dims = dims;
+    else dimsEl.innerHTML = dims;
+    node._dimsHtml = dims;
+  }
+  node._html = html;
+}
+
+function renderCard(s, dims, pred = renderCardPrediction(s)) {
+  const dir = safeVal(s.direction || 'neutral');
+  return `
+    <div class="signal-card" data-asset="${s._asset}">
+      <div class="score-stripe ${dir}"></div>
+      <div class="card-top">
+        <span class="asset">${s._asset}</span>
+        <span class="score ${dir}">${fmt1(s.composite_score || 0)}</span>
+      </div>
+      <span class="card-label ${s._labelClass}">${s._label}</span>
+      ${pred}
+      <div class="dimensions${dims == null ? ' pending' : ''}">${dims ?? ''}</div>
+    </div>`;
+}
+
+function renderCardDims(s) {
+  const dims = s.dimensions || {};
+  return `
+        ${renderDimBar('whale', dims.whale)}
+        ${renderDimBar('technical', dims.technical)}
+        ${renderDimBar('derivatives', dims.derivatives)}
+        ${renderDimBar('narrative', dims.narrative)}
+        ${renderDimBar('market', dims.market)}
+        ${renderDimBar('trend', dims.trend)}
+      `;
+}
+
+// Fusion rounds dimension scores to 0.1, so bar markup is memoized per
+// tenth (0..1000): class, width and label are built once per distinct score.
+const DIM_BAR_HTML = new Array(1001);
+
+function dimBarHtml(score) {
+  const cls = score >= 60 ? 'high' : score >= 45 ? 'mid' : 'low';
+  return `<div class="dim-bar-bg"><div class="dim-bar ${cls}" style="width:${score}%"></div></div>
+      <span class="dim-score">${score}</span>
+    </div>`;
 }
 
 function renderDimBar(name, dim) {
   const score = dim?.score || 0;
-  const cls = score >= 60 ? 'high' : score >= 45 ? 'mid' : 'low';
+  const i = Math.round(score * 10);
+  const bar = i >= 0 && i <= 1000 && i / 10 === score
+    ? (DIM_BAR_HTML[i] ||= dimBarHtml(score))
+    : dimBarHtml(score);
   return `
     <div class="dim-row">
       <span class="dim-name">${name}</span>
-      <div class="dim-bar-bg"><div class="dim-bar ${cls}" style="width:${score}%"></div></div>
-      <span class="dim-score">${score}</span>
-    </div>`;
+      ${bar}`;
 }
 
 function renderCardPrediction(s) {
-  const conv = s.conviction || 'none';
+  const conv = safeVal(s.conviction || 'none');
   const pm = s.predicted_move || {};
   const exp = pm.expected_pct || 0;
-  const strength = s.signal_strength || 'weak';
+  const strength = safeVal(s.signal_strength || 'weak');
 
   if (conv === 'none' && Math.abs(exp) < 0.01) {
     return `<div class="card-prediction">
@@ -996,91 +1570,194 @@ function renderCardPrediction(s) {
   </div>`;
 }
 
-function renderTable(list) {
-  const sortIcon = (field) => sortField === field ? (sortDir > 0 ? ' ▲' : ' ▼') : '';
-  const sortCls = (field) => sortField === field ? 'sorted' : '';
+const sortIcon = (field) => sortField === field ? (sortDir > 0 ? ' ▲' : ' ▼') : '';
+const sortCls = (field) => sortField === field ? 'sorted' : '';
+const sortTh = (field, title) =>
+  `<th class="${sortCls(field)}" data-sort="${field}">${title}<span>${sortIcon(field)}</span></th>`;
+
+let tableWin = null;
 
-  document.getElementById('content').innerHTML = `
+function renderTable(list) {
+  // A refresh keeps the live table, so its scroll position survives; only
+  // the rows are re-rendered from the new snapshot.
+  if (tableWin?.scroller.isConnected) {
+    resortTable(tableWin);
+    return;
+  }
+  setContent(`
+    <div class="vscroll" id="signalTableScroll">
     <table class="signal-table">
       <thead><tr>
-        <th class="${sortCls('asset')}" onclick="setSort('asset')">Asset${sortIcon('asset')}</th>
-        <th class="${sortCls('score')}" onclick="setSort('score')">Score${sortIcon('score')}</th>
+        ${sortTh('asset', 'Asset')}
+        ${sortTh('score', 'Score')}
         <th>Label</th>
-        <th class="${sortCls('whale')}" onclick="setSort('whale')">Whale${sortIcon('whale')}</th>
-        <th class="${sortCls('technical')}" onclick="setSort('technical')">Technical${sortIcon('technical')}</th>
-        <th class="${sortCls('derivatives')}" onclick="setSort('derivatives')">Derivatives${sortIcon('derivatives')}</th>
-        <th class="${sortCls('narrative')}" onclick="setSort('narrative')">Narrative${sortIcon('narrative')}</th>
-        <th class="${sortCls('market')}" onclick="setSort('market')">Market${sortIcon('market')}</th>
-        <th class="${sortCls('trend')}" onclick="setSort('trend')">Trend${sortIcon('trend')}</th>
+        ${sortTh('whale', 'Whale')}
+        ${sortTh('technical', 'Technical')}
+        ${sortTh('derivatives', 'Derivatives')}
+        ${sortTh('narrative', 'Narrative')}
+        ${sortTh('market', 'Market')}
+        ${sortTh('trend', 'Trend')}
         <th>Conviction</th>
         <th>Predicted</th>
         <th>Momentum</th>
       </tr></thead>
-      <tbody>
-        ${list.map(s => {
-          const dir = s.direction || 'neutral';
-          const color = dir === 'buy' ? 'var(--green)' : dir === 'sell' ? 'var(--red)' : 'var(--yellow)';
-          const dims = s.dimensions || {};
-          return `<tr onclick="openModal('${s.asset}')">
-            <td><strong>${s.asset}</strong></td>
-            <td class="table-score" style="color:${color}">${(s.composite_score||0).toFixed(1)}</td>
-            <td>${s.label || 'N/A'}</td>
-            <td style="color:${dimColor(dims.whale?.score)}">${dims.whale?.score ?? '—'}</td>
-            <td style="color:${dimColor(dims.technical?.score)}">${dims.technical?.score ?? '—'}</td>
-            <td style="color:${dimColor(dims.derivatives?.score)}">${dims.derivatives?.score ?? '—'}</td>
-            <td style="color:${dimColor(dims.narrative?.score)}">${dims.narrative?.score ?? '—'}</td>
-            <td style="color:${dimColor(dims.market?.score)}">${dims.market?.score ?? '—'}</td>
-            <td style="color:${dimColor(dims.trend?.score)}">${dims.trend?.score ?? '—'}</td>
-            <td><span class="conviction-badge ${s.conviction || 'none'}">${s.conviction || 'none'}</span></td>
-            <td class="predicted-move ${(s.predicted_move?.expected_pct||0) > 0 ? 'positive' : (s.predicted_move?.expected_pct||0) < 0 ? 'negative' : ''}">${(s.predicted_move?.expected_pct||0) !== 0 ? ((s.predicted_move?.expected_pct||0) > 0 ? '+' : '') + (s.predicted_move?.expected_pct||0).toFixed(1) + '%' : '—'}</td>
-            <td>${s.momentum || 'new'}</td>
-          </tr>`;
-        }).join('')}
-      </tbody>
-    </table>`;
+      <tbody></tbody>
+    </table>
+    </div>`);
+  // Rows are filled in by the window, only for what's on screen
+  tableWin = mountRowWindow(document.getElementById('signalTableScroll'), list, renderTableRow, 12, 1);
 }
 
-function dimColor(score) {
-  if (score == null) return 'var(--text-dim)';
-  if (score >= 60) return 'var(--green)';
-  if (score >= 45) return 'var(--yellow)';
-  return 'var(--red)';
+// A header click or a refresh on the live table keeps it: the sort indicators
+// are patched in place and the window re-renders its visible slice from the
+// current snapshot, in the current order.
+function resortTable(w) {
+  const list = sortedSignalList(sortField, sortDir);
+  const measured = new Map();
+  w.items.forEach((s, i) => measured.set(s.asset, w.heights[i]));
+  w.items = list;
+  w.heights = list.map(s => measured.get(s.asset) ?? WINDOW_ROW_H);
+  w.start = w.end = -1;
+  for (const th of w.scroller.querySelectorAll('th[data-sort]')) {
+    const field = th.dataset.sort;
+    th.classList.toggle('sorted', field === sortField);
+    th.lastChild.textContent = sortIcon(field);
+  }
+  updateRowWindow(w);
 }
 
+// Rows are cloned from one parsed skeleton and filled through textContent and
+// className, so scrolling and re-sorting the table never go through the HTML
+// parser (and asset/label text needs no escaping).
+const TABLE_ROW_TPL = (() => {
+  const tpl = document.createElement('template');
+  tpl.innerHTML = '<table><tbody><tr><td><strong></strong></td><td></td><td></td>'
+    + '<td></td>'.repeat(DIMENSIONS.length)
+    + '<td><span></span></td><td></td><td></td></tr></tbody></table>';
+  return tpl.content.querySelector('tr');
+})();
+
+function renderTableRow(s) {
+  const dims = s.dimensions || {};
+  const exp = s.predicted_move?.expected_pct || 0;
+  const conv = s.conviction || 'none';
+  const tr = TABLE_ROW_TPL.cloneNode(true);
+  const td = tr.cells;
+  tr.dataset.asset = s.asset;
+  td[0].firstChild.textContent = s.asset;
+  td[1].className = 'table-score ' + dirCls(s.direction);
+  td[1].textContent = fmt1(s.composite_score || 0);
+  td[2].textContent = s.label || 'N/A';
+  let c = 3;
+  for (let i = 0; i < DIMENSIONS.length; i++, c++) {
+    const score = dims[DIMENSIONS[i]]?.score;
+    td[c].className = dimCls(score);
+    td[c].textContent = score ?? '—';
+  }
+  td[c].firstChild.className = 'conviction-badge ' + conv;
+  td[c++].firstChild.textContent = conv;
+  td[c].className = 'predicted-move ' + (exp > 0 ? 'positive' : exp < 0 ? 'negative' : '');
+  td[c++].textContent = exp !== 0 ? (exp > 0 ? '+' : '') + exp.toFixed(1) + '%' : '—';
+  td[c].textContent = s.momentum || 'new';
+  return tr;
+}
+
+// Score colors are looked up by band index (0 red, 1 yellow, 2 green), so a
+// cell costs one table read instead of a compare-and-return chain. Hot cells
+// take the class form so every row shares the same few style rules.
+const SCORE_COLORS = Object.freeze(['var(--red)', 'var(--yellow)', 'var(--green)']);
+const SCORE_CLASSES = Object.freeze(['cell-down', 'cell-flat', 'cell-up']);
+const DIR_CLASSES = Object.freeze({ buy: 'cell-up', sell: 'cell-down', neutral: 'cell-flat' });
+
+function dirCls(dir) {
+  return DIR_CLASSES[dir] || DIR_CLASSES.neutral;
+}
+
+function dimCls(score) {
+  return score == null ? 'cell-dim' : SCORE_CLASSES[(score >= 45) + (score >= 60)];
+}
+
+function perfScoreCls(score) {
+  return score > 60 ? 'cell-up' : score < 40 ? 'cell-down' : 'cell-flat';
+}
+
+// Header clicks only update the sort state; the re-order is drawn once per
+// frame, so a burst of clicks costs one render.
 function setSort(field) {
   if (sortField === field) sortDir *= -1;
   else { sortField = field; sortDir = -1; }
-  renderSignals();
+  scheduleRender(applySort);
+}
+
+function applySort() {
+  if (currentView !== 'grid' && currentView !== 'table') return;
+  if (currentView === 'table' && tableWin?.scroller.isConnected) resortTable(tableWin);
+  else renderSignals();
+}
+
+// Payloads each tab is drawn from. The analytics endpoints change on every
+// poll (they count the dashboard's own requests), so a refresh only redraws
+// the tabs and panels that read what actually changed.
+const VIEW_SOURCES = Object.freeze({
+  grid: ['signal'],
+  table: ['signal'],
+  history: ['signal'],
+  performance: ['signal', 'perf'],
+  analytics: ['analytics'],
+  'signal-health': ['pipeline'],
+});
+const dataVersions = { signal: 0, health: 0, perf: 0, analytics: 0, pipeline: 0 };
+
+// `force` redraws the current tab even if none of its inputs changed.
+function dataChanged(touched, background, force = false) {
+  for (const source of touched) dataVersions[source]++;
+  if (touched.has('signal') || touched.has('perf')) scheduleRender(renderPortfolio, background);
+  if (touched.has('signal')) scheduleRender(renderInsight, background);
+  if (force || VIEW_SOURCES[currentView].some(source => touched.has(source))) {
+    scheduleRender(renderCurrentView, background);
+  }
+}
+
+// Per-tab DOM roots: leaving a tab parks its nodes in a detached holder, and
+// coming back re-attaches them as long as neither the tab's data nor the
+// sort changed in between — a reparent instead of a full re-render.
+const viewRoots = {};
+
+function viewVersion(view) {
+  return VIEW_SOURCES[view].map(source => dataVersions[source]).join('.') + '|' + sortField + '|' + sortDir;
 }
 
 function switchView(view, btn) {
+  // #content is empty while a switch's render is still pending; nothing to park.
+  if (view !== currentView && contentEl.hasChildNodes()) {
+    const holder = document.createElement('div');
+    holder.append(...contentEl.childNodes);
+    viewRoots[currentView] = { holder, version: viewVersion(currentView) };
+  }
   currentView = view;
   document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
   if (btn) btn.classList.add('active');
-  if (view === 'history') {
-    loadHistory();
-  } else if (view === 'performance') {
-    renderPerformance();
-  } else if (view === 'analytics') {
-    renderAnalytics();
-  } else if (view === 'signal-health') {
-    loadSignalHealth();
-  } else {
-    renderSignals();
+
+  const cached = viewRoots[view];
+  delete viewRoots[view];
+  if (cached && cached.version === viewVersion(view)) {
+    contentEl.replaceChildren(...cached.holder.childNodes);
+    return;
   }
+  scheduleRender(renderCurrentView);
 }
 
 // ===== SIGNAL HEALTH VIEW =====
 let signalHealthData = null;
 
 async function loadSignalHealth() {
-  document.getElementById('content').innerHTML = '<div class="loading"><div class="spinner"></div><span style="color:var(--text-dim)">Loading signal health...</span></div>';
+  contentEl.innerHTML = '<div class="loading"><div class="spinner"></div><span style="color:var(--text-dim)">Loading signal health...</span></div>';
   try {
     const res = await fetch(`${API_BASE}/analytics/signal-health`);
     signalHealthData = await res.json();
     renderSignalHealth();
   } catch(e) {
-    document.getElementById('content').innerHTML = '<div class="loading"><span style="color:var(--red)">Failed to load signal health</span></div>';
+    contentEl.innerHTML = '<div class="loading"><span style="color:var(--red)">Failed to load signal health</span></div>';
   }
 }
 
@@ -1100,12 +1777,12 @@ function renderSignalHealth() {
     <div style="display:grid; grid-template-columns:repeat(auto-fit, minmax(180px,1fr)); gap:12px; margin-bottom:24px;">
       <div class="portfolio-card">
         <div class="label">Regime</div>
-        <div class="value" style="color:${fgVal<25?'var(--red)':fgVal<45?'var(--yellow)':fgVal<60?'var(--text)':'var(--green)'}">${regimeName}</div>
-        <div class="sub">F&G: ${fgVal}</div>
+        <div class="value" style="color:${fgVal<25?'var(--red)':fgVal<45?'var(--yellow)':fgVal<60?'var(--text)':'var(--green)'}">${safeVal(regimeName)}</div>
+        <div class="sub">F&G: ${safeVal(fgVal)}</div>
       </div>
       <div class="portfolio-card">
         <div class="label">Config Version</div>
-        <div class="value" style="font-size:16px; font-family:monospace;">${configShort}</div>
+        <div class="value" style="font-size:16px; font-family:monospace;">${safeVal(configShort)}</div>
         <div class="sub">scoring profile hash</div>
       </div>
       <div class="portfolio-card">
@@ -1175,13 +1852,13 @@ function renderSignalHealth() {
 
     html += `
           <tr style="border-bottom:1px solid var(--border);">
-            <td style="padding:10px 12px; font-weight:600;">${dim.replace('_', ' ')}</td>
+            <td style="padding:10px 12px; font-weight:600;">${safeHtml(dim.replace('_', ' '))}</td>
             <td style="text-align:center; padding:10px 12px;">${fmtIC(ic24v)}</td>
             <td style="text-align:center; padding:10px 12px;">${fmtIC(ic48v)}</td>
             <td style="text-align:center; padding:10px 12px;">${icir != null ? icir.toFixed(2) : '—'}</td>
             <td style="text-align:center; padding:10px 12px;">${statusIcon(status)}</td>
             <td style="text-align:center; padding:10px 12px; font-weight:600;">${wt != null ? (wt * 100).toFixed(0) + '%' : '—'}</td>
-            <td style="padding:10px 12px; color:var(--text-dim); font-size:12px;">${reason}</td>
+            <td style="padding:10px 12px; color:var(--text-dim); font-size:12px;">${safeVal(reason)}</td>
           </tr>`;
   }
 
@@ -1221,7 +1898,7 @@ function renderSignalHealth() {
       const rv = byRegime[rk];
       html += `
           <tr style="border-bottom:1px solid var(--border);">
-            <td style="padding:10px 12px; font-weight:600;">${rk}</td>
+            <td style="padding:10px 12px; font-weight:600;">${safeHtml(rk)}</td>
             <td style="text-align:center; padding:10px 12px;">${fmtIC(rv.ic)}</td>
             <td style="text-align:center; padding:10px 12px;">${rv.observations || 0}</td>
             <td style="text-align:center; padding:10px 12px;">${rv.slices || 0}</td>
@@ -1239,7 +1916,7 @@ function renderSignalHealth() {
       <h3 style="font-size:15px; margin-bottom:12px; color:var(--red);">Decay Alerts</h3>`;
     for (const a of decayAlerts.alerts) {
       html += `<div style="padding:8px 0; border-bottom:1px solid var(--border); font-size:13px;">
-        <strong>${a.dimension}</strong>: IC dropped ${a.drop_pct ? a.drop_pct.toFixed(0) + '%' : ''}
+        <strong>${safeVal(a.dimension)}</strong>: IC dropped ${a.drop_pct ? a.drop_pct.toFixed(0) + '%' : ''}
         (${a.previous_ic != null ? a.previous_ic.toFixed(4) : '?'} → ${a.current_ic != null ? a.current_ic.toFixed(4) : '?'})
       </div>`;
     }
@@ -1263,15 +1940,15 @@ function renderSignalHealth() {
         <tbody>`;
 
     for (const entry of log.reverse()) {
-      const ts = entry.timestamp ? new Date(entry.timestamp).toLocaleString() : '?';
+      const ts = entry.timestamp ? fmtDateTime(entry.timestamp) : '?';
       const src = entry.source || '?';
       const wObj = entry.weights || {};
       const reasons = entry.reasons || {};
-      const changes = Object.entries(reasons).map(([k, v]) => `${k}: ${v}`).join(', ');
+      const changes = safeHtml(Object.entries(reasons).map(([k, v]) => `${k}: ${v}`).join(', '));
       html += `
           <tr style="border-bottom:1px solid var(--border);">
             <td style="padding:8px 10px; white-space:nowrap;">${ts}</td>
-            <td style="padding:8px 10px;">${src}</td>
+            <td style="padding:8px 10px;">${safeVal(src)}</td>
             <td style="padding:8px 10px; color:var(--text-dim);">${changes || '—'}</td>
           </tr>`;
     }
@@ -1288,7 +1965,7 @@ function renderSignalHealth() {
       <div style="display:flex; flex-wrap:wrap; gap:12px;">`;
     for (const [agent, mins] of Object.entries(cadences)) {
       html += `<div style="background:var(--surface2); border-radius:8px; padding:10px 16px;">
-        <div style="font-size:11px; color:var(--text-dim); text-transform:uppercase;">${agent.replace('_agent', '')}</div>
+        <div style="font-size:11px; color:var(--text-dim); text-transform:uppercase;">${safeHtml(agent.replace('_agent', ''))}</div>
         <div style="font-size:18px; font-weight:700; color:var(--cyan);">${mins}m</div>
       </div>`;
     }
@@ -1307,14 +1984,14 @@ function renderSignalHealth() {
     const ratio = pipe.eval_to_snapshot_ratio || 0;
     const bottleneck = pipe.bottleneck;
     const mktAssets = pipe.market_agent_assets || 0;
-    const lastEval = pipe.last_evaluation_ts ? new Date(pipe.last_evaluation_ts).toLocaleString() : 'Never';
-    const lastSnap = pipe.last_snapshot_ts ? new Date(pipe.last_snapshot_ts).toLocaleString() : 'Never';
+    const lastEval = pipe.last_evaluation_ts ? fmtDateTime(pipe.last_evaluation_ts) : 'Never';
+    const lastSnap = pipe.last_snapshot_ts ? fmtDateTime(pipe.last_snapshot_ts) : 'Never';
 
     html += `
     <div style="background:var(--surface); border:1px solid ${bottleneck ? 'rgba(239,68,68,0.3)' : 'var(--border)'}; border-radius:10px; padding:20px; margin-top:24px;">
       <h3 style="font-size:15px; margin-bottom:16px;">Pipeline Health</h3>
       ${bottleneck ? `<div style="background:rgba(239,68,68,0.1); border:1px solid rgba(239,68,68,0.3); border-radius:8px; padding:12px; margin-bottom:16px; font-size:13px; color:var(--red);">
-        <strong>Bottleneck:</strong> ${bottleneck}
+        <strong>Bottleneck:</strong> ${safeVal(bottleneck)}
       </div>` : ''}
       <div style="display:grid; grid-template-columns:repeat(auto-fit, minmax(140px,1fr)); gap:12px; margin-bottom:16px;">
         <div style="background:var(--surface2); border-radius:8px; padding:12px; text-align:center;">
@@ -1343,7 +2020,7 @@ function renderSignalHealth() {
     </div>`;
   }
 
-  document.getElementById('content').innerHTML = html;
+  setContent(html);
 }
 
 // ===== HISTORY VIEW =====
@@ -1353,53 +2030,191 @@ const historyLimit = 20;
 let historyTotal = 0;
 let expandedRows = new Set();
 
+// Recently viewed pages, oldest first. Revisiting one paints it at once and
+// the request only revalidates it.
+const historyPages = new Map(); // 'agent|limit|offset' -> page
+const HISTORY_PAGES_MAX = 8;
+
+// Status class, duration and timestamp cells are the same wherever a run is
+// drawn, so they are worked out once when its page arrives instead of each
+// time the window re-renders the row.
+function prepareRuns(rows, fusion) {
+  for (const row of rows) {
+    const d = row.data || {};
+    const meta = (fusion ? d.data?.meta : d.meta) || {};
+    const status = d.status || 'unknown';
+    row._status = safeHtml(status);
+    row._statusClass = status === 'ok' || status === 'partial' ? status : 'error';
+    row._dur = meta.duration_ms ? (meta.duration_ms/1000).toFixed(1)+'s' : '—';
+    row._ts = row.timestamp ? fmtDateTime(row.timestamp) : '—';
+  }
+}
+
 async function loadHistory() {
-  document.getElementById('content').innerHTML = '<div class="loading"><div class="spinner"></div><span style="color:var(--text-dim)">Loading history...</span></div>';
+  const fusion = historyAgent === 'signal_fusion';
+  const key = historyAgent + '|' + historyLimit + '|' + historyOffset;
+  const cached = historyPages.get(key);
+  if (cached) {
+    showHistoryPage(cached);
+  } else if (!contentEl.querySelector('.history-controls')) {
+    // A refresh keeps the current page on screen until the new one is ready,
+    // so the view is written once rather than spinner-then-table.
+    contentEl.innerHTML = '<div class="loading"><div class="spinner"></div><span style="color:var(--text-dim)">Loading history...</span></div>';
+  }
 
   try {
     const res = await fetch(`${API_BASE}/api/history?agent=${historyAgent}&limit=${historyLimit}&offset=${historyOffset}`);
     const data = await res.json();
-    historyTotal = data.total_rows;
-    expandedRows.clear();
-    renderHistory(data);
+    prepareRuns(data.rows || [], fusion);
+    historyPages.delete(key);
+    historyPages.set(key, data);
+    if (historyPages.size > HISTORY_PAGES_MAX) historyPages.delete(historyPages.keys().next().value);
+    // The user may have paged or left the tab meanwhile. Runs are only ever
+    // added, so an unchanged total means the page already shown is current.
+    if (currentView !== 'history' || key !== historyAgent + '|' + historyLimit + '|' + historyOffset) return;
+    if (cached && cached.total_rows === data.total_rows) return;
+    showHistoryPage(data);
   } catch(e) {
-    document.getElementById('content').innerHTML = '<div class="loading"><span style="color:var(--red)">Failed to load history</span></div>';
+    if (!cached) contentEl.innerHTML = '<div class="loading"><span style="color:var(--red)">Failed to load history</span></div>';
   }
 }
 
-function renderHistory(data) {
-  const rows = data.rows || [];
-  const totalPages = Math.ceil(historyTotal / historyLimit);
-  const currentPage = Math.floor(historyOffset / historyLimit) + 1;
+function showHistoryPage(data) {
+  historyTotal = data.total_rows;
+  expandedRows.clear();
+  dateTimeCache.clear();
+  renderHistory(data);
+}
 
-  let html = `
+// The control bar is written once per visit to the tab; paging only patches
+// its page text and button states and swaps the table after it.
+let historyCtl = null;
+
+const HISTORY_CONTROLS_HTML = `
     <div class="history-controls">
       <select onchange="historyAgent=this.value; historyOffset=0; loadHistory();">
-        <option value="signal_fusion" ${historyAgent==='signal_fusion'?'selected':''}>Signal Fusion (All Signals)</option>
-        <option value="technical_agent" ${historyAgent==='technical_agent'?'selected':''}>Technical Agent</option>
-        <option value="derivatives_agent" ${historyAgent==='derivatives_agent'?'selected':''}>Derivatives Agent</option>
-        <option value="market_agent" ${historyAgent==='market_agent'?'selected':''}>Market Agent</option>
-        <option value="whale_agent" ${historyAgent==='whale_agent'?'selected':''}>Whale Agent</option>
-        <option value="narrative_agent" ${historyAgent==='narrative_agent'?'selected':''}>Narrative Agent</option>
+        <option value="signal_fusion">Signal Fusion (All Signals)</option>
+        <option value="technical_agent">Technical Agent</option>
+        <option value="derivatives_agent">Derivatives Agent</option>
+        <option value="market_agent">Market Agent</option>
+        <option value="whale_agent">Whale Agent</option>
+        <option value="narrative_agent">Narrative Agent</option>
       </select>
-      <span class="page-info">${historyTotal} total runs &middot; Page ${currentPage} of ${totalPages || 1}</span>
-      <button onclick="historyOffset=Math.max(0,historyOffset-historyLimit); loadHistory();" ${historyOffset===0?'disabled':''}>&#9664; Prev</button>
-      <button onclick="historyOffset=Math.min(historyTotal-1,historyOffset+historyLimit); loadHistory();" ${historyOffset+historyLimit>=historyTotal?'disabled':''}>Next &#9654;</button>
+      <span class="page-info"></span>
+      <button onclick="historyOffset=Math.max(0,historyOffset-historyLimit); loadHistory();">&#9664; Prev</button>
+      <button onclick="historyOffset=Math.min(historyTotal-1,historyOffset+historyLimit); loadHistory();">Next &#9654;</button>
     </div>`;
 
-  if (historyAgent === 'signal_fusion') {
-    html += renderFusionHistory(rows);
+function renderHistory(data) {
+  const rows = data.rows || [];
+  const fusion = historyAgent === 'signal_fusion';
+  const table = fusion ? renderFusionHistory(rows) : renderAgentHistory(rows);
+
+  if (historyCtl?.bar.isConnected) {
+    const bar = historyCtl.bar;
+    while (bar.nextSibling) bar.nextSibling.remove();
+    bar.after(parseContent(table));
   } else {
-    html += renderAgentHistory(rows);
+    setContent(HISTORY_CONTROLS_HTML + table);
+    const bar = contentEl.querySelector('.history-controls');
+    const [prev, next] = bar.querySelectorAll('button');
+    historyCtl = { bar, prev, next, select: bar.querySelector('select'), info: bar.querySelector('.page-info') };
+  }
+  updateHistoryControls();
+
+  historyExpand = fusion ? renderFusionRunExpand : renderAgentRunExpand;
+  historyWin = rows.length
+    ? mountRowWindow(document.getElementById('historyScroll'), rows,
+        fusion ? renderFusionRow : renderAgentRow, fusion ? 9 : 7, 2)
+    : null;
+}
+
+function updateHistoryControls() {
+  const totalPages = Math.ceil(historyTotal / historyLimit);
+  const currentPage = Math.floor(historyOffset / historyLimit) + 1;
+  historyCtl.select.value = historyAgent;
+  historyCtl.info.textContent = `${historyTotal} total runs · Page ${currentPage} of ${totalPages || 1}`;
+  historyCtl.prev.disabled = historyOffset === 0;
+  historyCtl.next.disabled = historyOffset + historyLimit >= historyTotal;
+}
+
+// ===== WINDOWED TABLE ROWS =====
+// Only the items intersecting the scroll viewport (plus overscan) are in the
+// DOM; spacer rows stand in for the rest. Heights start as an estimate and
+// are replaced by measured values once an item has been rendered. An item
+// may span several <tr>s (a history run is its row plus the expand row).
+const WINDOW_ROW_H = 40;
+const WINDOW_OVERSCAN = 5;
+let historyWin = null;
+// Builds a history run's expand-row content; only called for expanded runs.
+let historyExpand = null;
+
+function mountRowWindow(scroller, items, renderItem, colspan, trsPerItem) {
+  const win = {
+    scroller, items, renderItem, colspan, trsPerItem,
+    tbody: scroller.querySelector('tbody'),
+    heights: items.map(() => WINDOW_ROW_H),
+    start: -1, end: -1, raf: 0,
+  };
+  scroller.addEventListener('scroll', () => {
+    if (win.raf) return;
+    win.raf = requestAnimationFrame(() => { win.raf = 0; updateRowWindow(win); });
+  }, { passive: true });
+  updateRowWindow(win);
+  return win;
+}
+
+function updateRowWindow(w) {
+  if (!w || !w.scroller.isConnected) return;
+  const headH = w.scroller.querySelector('thead')?.offsetHeight || 0;
+  const top = Math.max(0, w.scroller.scrollTop - headH);
+  const bottom = top + (w.scroller.clientHeight || window.innerHeight);
+  const n = w.heights.length;
+  let i = 0, y = 0;
+  while (i < n && y + w.heights[i] <= top) y += w.heights[i++];
+  const first = i;
+  while (i < n && y < bottom) y += w.heights[i++];
+  const start = Math.max(0, first - WINDOW_OVERSCAN);
+  const end = Math.min(n, i + WINDOW_OVERSCAN);
+  if (start === w.start && end === w.end) return;
+  w.start = start;
+  w.end = end;
+
+  let above = 0, below = 0;
+  for (let k = 0; k < start; k++) above += w.heights[k];
+  for (let k = end; k < n; k++) below += w.heights[k];
+  // renderItem returns markup (history) or a ready <tr> (signal table).
+  const rows = [];
+  for (let k = start; k < end; k++) rows.push(w.renderItem(w.items[k], k));
+  if (rows.length && typeof rows[0] !== 'string') {
+    const spacer = (h) => {
+      if (!h) return [];
+      const tr = document.createElement('tr');
+      const td = tr.insertCell();
+      tr.className = 'vspacer';
+      tr.style.height = h + 'px';
+      td.colSpan = w.colspan;
+      return [tr];
+    };
+    w.tbody.replaceChildren(...spacer(above), ...rows, ...spacer(below));
+  } else {
+    const spacer = (h) => h ? `<tr class="vspacer" style="height:${h}px"><td colspan="${w.colspan}"></td></tr>` : '';
+    w.tbody.innerHTML = spacer(above) + rows.join('') + spacer(below);
   }
 
-  document.getElementById('content').innerHTML = html;
+  // Swap estimates for real heights of what was just rendered
+  const trs = w.tbody.children;
+  for (let k = start, j = above ? 1 : 0; k < end; k++) {
+    let h = 0;
+    for (let t = 0; t < w.trsPerItem; t++) h += trs[j++].offsetHeight;
+    w.heights[k] = h;
+  }
 }
 
 function renderFusionHistory(rows) {
   if (!rows.length) return '<p style="color:var(--text-dim);padding:20px;">No fusion history yet. Data appears after the first 15-minute cycle.</p>';
 
-  let html = `<table class="history-table">
+  const html = `<table class="history-table">
     <thead><tr>
       <th style="width:30px;"></th>
       <th>Run #</th>
@@ -1410,75 +2225,78 @@ function renderFusionHistory(rows) {
       <th>Regime</th>
       <th>Agents</th>
       <th>Duration</th>
-    </tr></thead><tbody>`;
+    </tr></thead><tbody></tbody></table>`;
+  return `<div class="vscroll" id="historyScroll">${html}</div>`;
+}
 
-  rows.forEach((row, idx) => {
-    const d = row.data || {};
-    const ps = d.data?.portfolio_summary || {};
-    const meta = d.data?.meta || {};
-    const status = d.status || 'unknown';
-    const statusClass = status === 'ok' ? 'ok' : status === 'partial' ? 'partial' : 'error';
-    const topBuy = ps.top_buys?.[0];
-    const topSell = ps.top_sells?.[0];
-    const regime = (ps.market_regime || '—').replace(/_/g, ' ');
-    const agents = (meta.agents_available || []).length;
-    const dur = meta.duration_ms ? (meta.duration_ms/1000).toFixed(1)+'s' : '—';
-    const ts = row.timestamp ? new Date(row.timestamp).toLocaleString() : '—';
-    const rowId = 'hrow_' + idx;
+function renderFusionRow(row, idx) {
+  const d = row.data || {};
+  const ps = d.data?.portfolio_summary || {};
+  const meta = d.data?.meta || {};
+  const topBuy = ps.top_buys?.[0];
+  const topSell = ps.top_sells?.[0];
+  const regime = spaced(ps.market_regime || '—');
+  const agents = (meta.agents_available || []).length;
+  const rowId = 'hrow_' + idx;
+  const open = expandedRows.has(rowId);
 
-    html += `
-      <tr onclick="toggleExpand('${rowId}')">
-        <td style="color:var(--text-dim)">${expandedRows.has(rowId) ? '▼' : '▶'}</td>
-        <td><strong>#${row.id}</strong></td>
-        <td>${ts}</td>
-        <td><span class="run-status ${statusClass}">${status}</span></td>
-        <td style="color:var(--green)">${topBuy ? topBuy.asset + ' ' + topBuy.score : '—'}</td>
-        <td style="color:var(--red)">${topSell ? topSell.asset + ' ' + topSell.score : '—'}</td>
-        <td>${regime}</td>
-        <td>${agents}/5</td>
-        <td>${dur}</td>
-      </tr>
-      <tr class="expand-row ${expandedRows.has(rowId)?'open':''}" id="${rowId}">
-        <td colspan="9">${renderFusionExpand(d)}</td>
-      </tr>`;
-  });
+  return `
+    <tr data-expand aria-expanded="${open}">
+      <td class="arrow"></td>
+      <td><strong>#${row.id}</strong></td>
+      <td>${row._ts}</td>
+      <td><span class="run-status ${row._statusClass}">${row._status}</span></td>
+      <td style="color:var(--green)">${topBuy ? safeHtml(topBuy.asset) + ' ' + topBuy.score : '—'}</td>
+      <td style="color:var(--red)">${topSell ? safeHtml(topSell.asset) + ' ' + topSell.score : '—'}</td>
+      <td>${regime}</td>
+      <td>${agents}/5</td>
+      <td>${row._dur}</td>
+    </tr>
+    <tr class="expand-row ${open?'open':''}" id="${rowId}">
+      <td colspan="9">${open ? renderFusionRunExpand(row) : ''}</td>
+    </tr>`;
+}
 
-  html += '</tbody></table>';
+// Expanded-run markup per row object. The window rebuilds open runs each
+// time they scroll back into view, and cached pages bring the same row
+// objects back; a WeakMap lets the entries go with their page.
+const runExpandCache = new WeakMap();
+
+function cachedRunExpand(row, render) {
+  let html = runExpandCache.get(row);
+  if (html === undefined) runExpandCache.set(row, html = render(row));
   return html;
 }
 
+function renderFusionRunExpand(row) {
+  return cachedRunExpand(row, r => renderFusionExpand(r.data || {}));
+}
+
 function renderFusionExpand(d) {
-  const signals = d.data?.signals || {};
-  const entries = Object.entries(signals);
+  // The window re-renders a run each time it scrolls back into view; sort its
+  // assets once and keep the order on the run.
+  const entries = d._sorted ||= Object.entries(d.data?.signals || {})
+    .sort((a,b) => (b[1].composite_score||0) - (a[1].composite_score||0));
   if (!entries.length) return '<span style="color:var(--text-dim)">No signal data in this run</span>';
 
-  let html = '<div class="expand-content">';
-  entries.sort((a,b) => (b[1].composite_score||0) - (a[1].composite_score||0));
-
-  entries.forEach(([asset, s]) => {
-    const score = s.composite_score || 0;
-    const dir = s.direction || 'neutral';
-    const color = dir === 'buy' ? 'var(--green)' : dir === 'sell' ? 'var(--red)' : 'var(--yellow)';
+  return `<div class="expand-content">${entries.map(([asset, s]) => {
     const dims = s.dimensions || {};
-    html += `
+    return `
       <div class="expand-asset">
-        <div class="ea-name">${asset}</div>
-        <div class="ea-score" style="color:${color}">${score.toFixed(1)}</div>
-        <div class="ea-label">${s.label || 'N/A'}</div>
+        <div class="ea-name">${safeHtml(asset)}</div>
+        <div class="ea-score ${dirCls(s.direction)}">${fmt1(s.composite_score || 0)}</div>
+        <div class="ea-label">${safeHtml(s.label || 'N/A')}</div>
         <div class="ea-dims">
           W:${dims.whale?.score??'—'} T:${dims.technical?.score??'—'} D:${dims.derivatives?.score??'—'} N:${dims.narrative?.score??'—'} M:${dims.market?.score??'—'}
         </div>
       </div>`;
-  });
-
-  html += '</div>';
-  return html;
+  }).join('')}</div>`;
 }
 
 function renderAgentHistory(rows) {
   if (!rows.length) return '<p style="color:var(--text-dim);padding:20px;">No data yet for this agent.</p>';
 
-  let html = `<table class="history-table">
+  const html = `<table class="history-table">
     <thead><tr>
       <th style="width:30px;"></th>
       <th>Run #</th>
@@ -1487,58 +2305,114 @@ function renderAgentHistory(rows) {
       <th>Duration</th>
       <th>Errors</th>
       <th>Assets Covered</th>
-    </tr></thead><tbody>`;
+    </tr></thead><tbody></tbody></table>`;
+  return `<div class="vscroll" id="historyScroll">${html}</div>`;
+}
 
-  rows.forEach((row, idx) => {
-    const d = row.data || {};
-    const meta = d.meta || {};
-    const status = d.status || 'unknown';
-    const statusClass = status === 'ok' ? 'ok' : status === 'partial' ? 'partial' : 'error';
-    const dur = meta.duration_ms ? (meta.duration_ms/1000).toFixed(1)+'s' : '—';
-    const errors = (meta.errors || []).length;
-    const assets = Object.keys(d.data?.per_asset || d.data || {}).length;
-    const ts = row.timestamp ? new Date(row.timestamp).toLocaleString() : '—';
-    const rowId = 'arow_' + idx;
+function renderAgentRow(row, idx) {
+  const d = row.data || {};
+  const meta = d.meta || {};
+  const errors = (meta.errors || []).length;
+  const assets = countKeys(d.data?.per_asset || d.data || {});
+  const rowId = 'arow_' + idx;
+  const open = expandedRows.has(rowId);
 
-    html += `
-      <tr onclick="toggleExpand('${rowId}')">
-        <td style="color:var(--text-dim)">${expandedRows.has(rowId) ? '▼' : '▶'}</td>
-        <td><strong>#${row.id}</strong></td>
-        <td>${ts}</td>
-        <td><span class="run-status ${statusClass}">${status}</span></td>
-        <td>${dur}</td>
-        <td>${errors > 0 ? '<span style="color:var(--red)">'+errors+'</span>' : '0'}</td>
-        <td>${assets}</td>
-      </tr>
-      <tr class="expand-row ${expandedRows.has(rowId)?'open':''}" id="${rowId}">
-        <td colspan="7">
-          <pre style="font-size:12px;color:var(--text-dim);white-space:pre-wrap;max-height:400px;overflow-y:auto;">${JSON.stringify(d.data || d, null, 2).substring(0, 5000)}</pre>
-        </td>
-      </tr>`;
-  });
+  return `
+    <tr data-expand aria-expanded="${open}">
+      <td class="arrow"></td>
+      <td><strong>#${row.id}</strong></td>
+      <td>${row._ts}</td>
+      <td><span class="run-status ${row._statusClass}">${row._status}</span></td>
+      <td>${row._dur}</td>
+      <td>${errors > 0 ? '<span style="color:var(--red)">'+errors+'</span>' : '0'}</td>
+      <td>${assets}</td>
+    </tr>
+    <tr class="expand-row ${open?'open':''}" id="${rowId}">
+      <td colspan="7">${open ? renderAgentRunExpand(row) : ''}</td>
+    </tr>`;
+}
 
-  html += '</tbody></table>';
-  return html;
+// Object.keys(o).length without building the key array.
+function countKeys(o) {
+  let n = 0;
+  for (const _ in o) n++;
+  return n;
 }
 
-function toggleExpand(rowId) {
-  const el = document.getElementById(rowId);
-  if (!el) return;
-  if (expandedRows.has(rowId)) {
-    expandedRows.delete(rowId);
-    el.classList.remove('open');
-  } else {
-    expandedRows.add(rowId);
-    el.classList.add('open');
+function renderAgentRunExpand(row) {
+  return cachedRunExpand(row, agentRunDump);
+}
+
+function agentRunDump(row) {
+  const d = row.data || {};
+  return `<pre style="font-size:12px;color:var(--text-dim);white-space:pre-wrap;max-height:400px;overflow-y:auto;">${safeHtml(stringifyBounded(d.data || d, 5000))}</pre>`;
+}
+
+// JSON.stringify(value, null, 2).substring(0, limit), except that the walk
+// stops once `limit` characters are written instead of pretty-printing the
+// whole payload first.
+const STRINGIFY_STOP = {};
+
+function stringifyBounded(value, limit) {
+  let out = '';
+  const walk = (v, pad) => {
+    if (out.length >= limit) throw STRINGIFY_STOP;
+    if (v === null || typeof v !== 'object') {
+      out += JSON.stringify(v) ?? 'null';
+      return;
+    }
+    const inner = pad + '  ';
+    if (Array.isArray(v)) {
+      if (!v.length) { out += '[]'; return; }
+      out += '[';
+      for (let i = 0; i < v.length; i++) {
+        out += (i ? ',\\n' : '\\n') + inner;
+        walk(v[i], inner);
+      }
+      out += '\\n' + pad + ']';
+      return;
+    }
+    let empty = true;
+    out += '{';
+    for (const k in v) {
+      const x = v[k];
+      if (x === undefined || typeof x === 'function') continue;
+      out += (empty ? '\\n' : ',\\n') + inner + JSON.stringify(k) + ': ';
+      empty = false;
+      walk(x, inner);
+    }
+    out += empty ? '}' : '\\n' + pad + '}';
+  };
+  try { walk(value, ''); } catch (e) { if (e !== STRINGIFY_STOP) throw e; }
+  return out.length > limit ? out.slice(0, limit) : out;
+}
+
+// `head` is the clicked run row; its expand row is the next sibling.
+function toggleExpand(head) {
+  const el = head.nextElementSibling;
+  const rowId = el.id;
+  const idx = +rowId.split('_')[1];
+  const open = !expandedRows.has(rowId);
+  if (open) expandedRows.add(rowId);
+  else expandedRows.delete(rowId);
+  // Collapsed runs are rendered with an empty expand row; fill it on first open
+  const cell = el.firstElementChild;
+  if (open && !cell.hasChildNodes()) cell.innerHTML = historyExpand(historyWin.items[idx]);
+  // All writes (content, row class, arrow state) land before the one layout
+  // read below, so the toggle costs a single style/layout pass. The arrow
+  // glyph itself is drawn by CSS from aria-expanded.
+  el.classList.toggle('open', open);
+  head.setAttribute('aria-expanded', String(open));
+  // The run's height changed; keep the window's spacer math in sync
+  if (historyWin) {
+    historyWin.heights[idx] = head.offsetHeight + el.offsetHeight;
+    updateRowWindow(historyWin);
   }
-  // Update the arrow in the previous row
-  const prevTd = el.previousElementSibling?.querySelector('td');
-  if (prevTd) prevTd.textContent = expandedRows.has(rowId) ? '▼' : '▶';
 }
 
 function renderModalPrediction(s) {
-  const conv = s.conviction || 'none';
-  const strength = s.signal_strength || 'weak';
+  const conv = safeVal(s.conviction || 'none');
+  const strength = safeVal(s.signal_strength || 'weak');
   const pm = s.predicted_move || {};
   const ml = s.meta_learner || {};
   const mlb = s.meta_label || {};
@@ -1552,7 +2426,7 @@ function renderModalPrediction(s) {
   const rangeStr = (pm.range_low_pct != null && pm.range_high_pct != null && exp !== 0)
     ? `Range: ${pm.range_low_pct > 0 ? '+' : ''}${pm.range_low_pct.toFixed(1)}% to ${pm.range_high_pct > 0 ? '+' : ''}${pm.range_high_pct.toFixed(1)}%`
     : '';
-  const horizon = pm.horizon || '24h';
+  const horizon = safeVal(pm.horizon || '24h');
 
   const convColor = conv === 'high' ? 'green' : conv === 'medium' ? 'blue' : conv === 'low' ? 'yellow' : 'dim';
   const strengthColor = strength === 'strong' ? 'green' : strength === 'moderate' ? 'blue' : 'dim';
@@ -1599,59 +2473,84 @@ function renderModalPrediction(s) {
     </div>`;
 }
 
+// Modal dimension rows keyed by their inputs. Reopening an asset between
+// refreshes, or one whose dimensions did not move, reuses the markup.
+const modalDimCache = new Map();
+
+function modalDimItem(d, dim) {
+  const sc = dim.score ?? 0;
+  const key = d + '\\0' + sc + '\\0' + dim.label + '\\0' + dim.detail;
+  let html = modalDimCache.get(key);
+  if (html === undefined) {
+    if (modalDimCache.size >= 500) modalDimCache.clear();
+    html = `
+          <div class="modal-dim-item">
+            <div class="left">
+              <span class="dim-title">${safeHtml(d)}</span>
+              <span class="dim-detail">${safeHtml(dim.detail || 'no data')}</span>
+            </div>
+            <span class="dim-badge ${dimCls(sc)}">
+              ${sc} — ${safeHtml(dim.label || 'N/A')}
+            </span>
+          </div>`;
+    modalDimCache.set(key, html);
+  }
+  return html;
+}
+
+// The whole dimension list, keyed by the six (score, label, detail) triples:
+// reopening an unchanged asset skips even the per-row lookups and the join.
+const modalDimBlockCache = new Map();
+
+function modalDimBlock(dims) {
+  let key = '';
+  for (const d of DIMENSIONS) {
+    const dim = dims[d] || {};
+    key += (dim.score ?? 0) + '\\0' + dim.label + '\\0' + dim.detail + '\\0';
+  }
+  let html = modalDimBlockCache.get(key);
+  if (html === undefined) {
+    if (modalDimBlockCache.size >= 200) modalDimBlockCache.clear();
+    html = DIMENSIONS.map(d => modalDimItem(d, dims[d] || {})).join('');
+    modalDimBlockCache.set(key, html);
+  }
+  return html;
+}
+
 function openModal(asset) {
-  const signals = signalData?.data?.signals;
-  const s = signals?.[asset];
+  const s = signalData?._byAsset?.get(asset);
   if (!s) return;
 
-  const dir = s.direction || 'neutral';
-  const color = dir === 'buy' ? 'var(--green)' : dir === 'sell' ? 'var(--red)' : 'var(--yellow)';
   const dims = s.dimensions || {};
-  const dimOrder = ['whale', 'technical', 'derivatives', 'narrative', 'market', 'trend'];
 
   const insightHTML = s.llm_insight
     ? `<div class="modal-insight">${formatMarkdown(s.llm_insight)}</div>`
     : '';
 
-  document.getElementById('modal').innerHTML = `
+  modalEl.innerHTML = `
     <div class="modal-header">
-      <h2>${asset}</h2>
+      <h2>${s._asset}</h2>
       <button class="modal-close" onclick="closeModal()">&times;</button>
     </div>
-    <div class="modal-score" style="color:${color}">${(s.composite_score||0).toFixed(1)}</div>
-    <span class="card-label ${(s.label||'').toLowerCase().replace(/ /g, '-')}">${s.label || 'N/A'}</span>
+    <div class="modal-score ${dirCls(s.direction)}">${fmt1(s.composite_score||0)}</div>
+    <span class="card-label ${s._labelClass}">${s._label}</span>
     <div style="color:var(--text-dim);font-size:13px;margin-top:4px;">
-      ${s.momentum ? 'Momentum: ' + s.momentum : ''}
+      ${s.momentum ? 'Momentum: ' + safeVal(s.momentum) : ''}
       ${s.prev_score != null ? ' | Prev: ' + s.prev_score : ''}
     </div>
     ${renderModalPrediction(s)}
     <div class="modal-dim-detail">
-      ${dimOrder.map(d => {
-        const dim = dims[d] || {};
-        const sc = dim.score ?? 0;
-        const bgColor = sc >= 60 ? 'var(--green-bg)' : sc >= 45 ? 'var(--yellow-bg)' : 'var(--red-bg)';
-        const fgColor = sc >= 60 ? 'var(--green)' : sc >= 45 ? 'var(--yellow)' : 'var(--red)';
-        return `
-          <div class="modal-dim-item">
-            <div class="left">
-              <span class="dim-title">${d}</span>
-              <span class="dim-detail">${dim.detail || 'no data'}</span>
-            </div>
-            <span class="dim-badge" style="background:${bgColor};color:${fgColor}">
-              ${sc} — ${dim.label || 'N/A'}
-            </span>
-          </div>`;
-      }).join('')}
+      ${modalDimBlock(dims)}
     </div>
     ${insightHTML}
   `;
 
-  document.getElementById('modalOverlay').classList.add('active');
+  overlayEl.classList.add('active');
 }
 
 function closeModal(e) {
-  if (e && e.target !== document.getElementById('modalOverlay')) return;
-  document.getElementById('modalOverlay').classList.remove('active');
+  if (e && e.target !== overlayEl) return;
+  overlayEl.classList.remove('active');
 }
 
 document.addEventListener('keydown', (e) => {
@@ -1659,6 +2558,20 @@ document.addEventListener('keydown', (e) => {
 });
 
 // ===== PERFORMANCE VIEW =====
+// Sorted Object.entries of a payload's map, cached per map object. fetchAll
+// assigns fresh payloads, so a re-render of unchanged data skips the sort.
+const sortedEntriesCache = new WeakMap();
+const byCountDesc = (a, b) => b[1] - a[1];
+
+function sortedEntries(obj, cmp) {
+  let entries = sortedEntriesCache.get(obj);
+  if (!entries) {
+    entries = Object.entries(obj).sort(cmp);
+    sortedEntriesCache.set(obj, entries);
+  }
+  return entries;
+}
+
 function renderReputationCard() {
   if (!perfData) return '';
   if (perfData.status === 'collecting_data') {
@@ -1671,26 +2584,22 @@ function renderReputationCard() {
       </div>`;
   }
   const rep = perfData.reputation_score || 0;
-  const repColor = rep >= 65 ? 'var(--green)' : rep >= 50 ? 'var(--yellow)' : 'var(--red)';
   return `
     <div class="portfolio-card" style="cursor:pointer" onclick="switchView('performance', document.querySelector('[data-view=performance]'))">
       <div class="label">Reputation Score</div>
-      <div class="value" style="color:${repColor}">${rep}</div>
+      <div class="value" style="color:${repColor(rep)}">${rep}</div>
       <div class="sub">${perfData.accuracy_30d || 0}% accuracy (All Time)</div>
     </div>`;
 }
 
 function repColor(val) {
-  if (val >= 65) return 'var(--green)';
-  if (val >= 50) return 'var(--yellow)';
-  return 'var(--red)';
+  return SCORE_COLORS[(val >= 50) + (val >= 65)];
 }
 
 function renderPerformance() {
-  const content = document.getElementById('content');
 
   if (!perfData) {
-    content.innerHTML = '<div class="loading"><div class="spinner"></div><span style="color:var(--text-dim)">Loading performance data...</span></div>';
+    contentEl.innerHTML = '<div class="loading"><div class="spinner"></div><span style="color:var(--text-dim)">Loading performance data...</span></div>';
     return;
   }
 
@@ -1700,9 +2609,7 @@ function renderPerformance() {
     // Show current signals with directions + reasoning
     let signalRows = '';
     if (signalData) {
-      const signals = signalData.data?.signals || {};
-      const sorted = Object.entries(signals).sort((a,b) => (b[1].composite_score||0) - (a[1].composite_score||0));
-      signalRows = sorted.map(([asset, s]) => {
+      signalRows = sortedSignalList('score', -1).map(s => {
         const score = s.composite_score || 0;
         let dir = 'neutral';
         if (score > 60) dir = 'bullish';
@@ -1713,19 +2620,19 @@ function renderPerformance() {
         for (const [dName, dData] of Object.entries(dims)) {
           const detail = dData?.detail;
           if (detail && detail !== 'no data' && detail !== 'no scorer') {
-            reasons.push('<strong>' + dName.charAt(0).toUpperCase() + dName.slice(1) + ':</strong> ' + detail);
+            reasons.push('<strong>' + safeHtml(dName.charAt(0).toUpperCase() + dName.slice(1)) + ':</strong> ' + safeVal(detail));
           }
         }
         return `<tr>
-          <td><strong>${asset}</strong></td>
-          <td style="font-weight:700;color:${score > 60 ? 'var(--green)' : score < 40 ? 'var(--red)' : 'var(--yellow)'}">${score.toFixed(1)}</td>
+          <td><strong>${s._asset}</strong></td>
+          <td class="${perfScoreCls(score)}" style="font-weight:700">${fmt1(score)}</td>
           <td><span class="dir-badge ${dir}">${dir.toUpperCase()}</span></td>
           <td style="font-size:12px;line-height:1.6;color:var(--text-dim)">${reasons.join('<br>') || 'No details'}</td>
         </tr>`;
       }).join('');
     }
 
-    content.innerHTML = `
+    setContent(`
       <div class="perf-collecting">
         <div class="pc-icon">&#128202;</div>
         <div class="pc-title">Performance Tracking Active</div>
@@ -1750,7 +2657,7 @@ function renderPerformance() {
         After 24h/48h, we compare predicted direction vs actual price movement.
         Price source: CoinGecko + Binance. Scoring: Gradient (0.0-1.0) based on direction AND magnitude. Window: All Time.
       </div>
-    `;
+    `);
     return;
   }
 
@@ -1783,10 +2690,10 @@ function renderPerformance() {
   }).join('');
 
   // Per-asset cards
-  const assetEntries = Object.entries(byAsset).sort((a,b) => b[1] - a[1]);
+  const assetEntries = sortedEntries(byAsset, byCountDesc);
   const assetCards = assetEntries.map(([asset, acc]) => `
     <div class="perf-asset-card">
-      <span class="pa-name">${asset}</span>
+      <span class="pa-name">${safeHtml(asset)}</span>
       <span class="pa-acc" style="color:${repColor(acc)}">${acc}%</span>
     </div>
   `).join('');
@@ -1794,9 +2701,8 @@ function renderPerformance() {
   // Current signals table with reasoning
   let signalRows = '';
   if (signalData) {
-    const signals = signalData.data?.signals || {};
-    const sorted = Object.entries(signals).sort((a,b) => (b[1].composite_score||0) - (a[1].composite_score||0));
-    signalRows = sorted.map(([asset, s]) => {
+    signalRows = sortedSignalList('score', -1).map(s => {
+      const asset = s.asset;
       const score = s.composite_score || 0;
       let dir = 'neutral';
       if (score > 60) dir = 'bullish';
@@ -1810,12 +2716,12 @@ function renderPerformance() {
       for (const [dName, dData] of Object.entries(dims)) {
         const detail = dData?.detail;
         if (detail && detail !== 'no data' && detail !== 'no scorer') {
-          reasons.push('<strong>' + dName.charAt(0).toUpperCase() + dName.slice(1) + ':</strong> ' + detail);
+          reasons.push('<strong>' + safeHtml(dName.charAt(0).toUpperCase() + dName.slice(1)) + ':</strong> ' + safeVal(detail));
         }
       }
       return `<tr>
-        <td><strong>${asset}</strong></td>
-        <td style="font-weight:700;color:${score > 60 ? 'var(--green)' : score < 40 ? 'var(--red)' : 'var(--yellow)'}">${score.toFixed(1)}</td>
+        <td><strong>${s._asset}</strong></td>
+        <td class="${perfScoreCls(score)}" style="font-weight:700">${fmt1(score)}</td>
         <td><span class="dir-badge ${dir}">${dir.toUpperCase()}</span></td>
         <td>${accBadge}</td>
         <td style="font-size:12px;line-height:1.6;color:var(--text-dim)">${reasons.join('<br>') || 'No details'}</td>
@@ -1823,7 +2729,7 @@ function renderPerformance() {
     }).join('');
   }
 
-  content.innerHTML = `
+  setContent(`
     <div class="perf-header">
       <div class="perf-score-card">
         <div class="perf-big" style="color:${repColor(rep)}">${rep}</div>
@@ -1863,7 +2769,7 @@ function renderPerformance() {
       <strong>Price source:</strong> CoinGecko + Binance. <strong>Scoring:</strong> Gradient (0.0-1.0) based on direction AND magnitude. <strong>Window:</strong> All Time.
       <strong>Scale:</strong> 1.0 = strong correct (&gt;5%), 0.7 = moderate (2-5%), 0.4 = weak correct (&lt;2%), 0.2 = weak wrong, 0.0 = clear wrong.
     </div>
-  `;
+  `);
 }
 
 // ===== ANALYTICS VIEW =====
@@ -1881,15 +2787,15 @@ function renderAttribution(d) {
   `;
 
   // 1. External client type bars
-  const typeEntries = Object.entries(extTypes).sort((a,b) => b[1] - a[1]);
-  const maxType = Math.max(...typeEntries.map(e => e[1]), 1);
+  const typeEntries = sortedEntries(extTypes, byCountDesc);
+  const maxType = Math.max(typeEntries[0]?.[1] || 0, 1); // sorted by count, desc
   const typeBars = typeEntries.map(([type, count]) => {
     const pct = ((count / maxType) * 100).toFixed(0);
     const share = ((count / extTotal) * 100).toFixed(0);
     const isAI = aiTypes.includes(type);
     const barColor = isAI ? 'background:var(--green)' : '';
     return `<div class="attr-row">
-      <span class="attr-label" style="${isAI ? 'color:var(--green)' : ''}">${type.replace(/_/g, ' ')}</span>
+      <span class="attr-label" style="${isAI ? 'color:var(--green)' : ''}">${spaced(type)}</span>
       <div class="attr-bar-bg"><div class="attr-bar" style="width:${pct}%;${barColor}"></div></div>
       <span class="attr-count">${count}</span>
       <span class="attr-pct">${share}%</span>
@@ -1900,30 +2806,30 @@ function renderAttribution(d) {
   const uaRows = extUAs.slice(0, 10).map(ua => {
     const isAI = aiTypes.includes(ua.type);
     return `<tr>
-      <td style="font-size:12px;word-break:break-all;max-width:400px;${isAI ? 'color:var(--green)' : ''}">${ua.user_agent}</td>
-      <td><span class="dir-badge ${isAI ? 'bullish' : 'neutral'}">${ua.type.replace(/_/g, ' ').toUpperCase()}</span></td>
+      <td style="font-size:12px;word-break:break-all;max-width:400px;${isAI ? 'color:var(--green)' : ''}">${safeVal(ua.user_agent)}</td>
+      <td><span class="dir-badge ${isAI ? 'bullish' : 'neutral'}">${spaced(ua.type).toUpperCase()}</span></td>
       <td style="font-weight:700">${ua.requests}</td>
     </tr>`;
   }).join('');
 
   // 3. External endpoints
-  const epEntries = Object.entries(extEndpoints).sort((a,b) => b[1] - a[1]);
-  const maxEp = Math.max(...epEntries.map(e => e[1]), 1);
+  const epEntries = sortedEntries(extEndpoints, byCountDesc);
+  const maxEp = Math.max(epEntries[0]?.[1] || 0, 1); // sorted by count, desc
   const epRows = epEntries.map(([ep, count]) => {
     const pct = (count / maxEp) * 100;
     return `<tr>
-      <td><code>${ep}</code></td>
+      <td><code>${safeHtml(ep)}</code></td>
       <td style="font-weight:700">${count}</td>
       <td style="width:40%"><div class="ep-bar-bg"><div class="ep-bar" style="width:${pct}%"></div></div></td>
     </tr>`;
   }).join('');
 
   // 4. Referrer sources (non-direct only)
-  const refEntries = Object.entries(refSources).filter(([k]) => k !== 'direct').sort((a,b) => b[1] - a[1]);
+  const refEntries = sortedEntries(refSources, byCountDesc).filter(([k]) => k !== 'direct');
   const refSection = refEntries.length ? `
     <div style="margin-top:12px;font-size:13px;">
       <strong style="color:var(--text-dim)">Referred by:</strong>
-      ${refEntries.map(([src, cnt]) => `<span style="margin-left:12px;color:var(--cyan)">${src}</span> <span style="color:var(--text-dim)">(${cnt})</span>`).join('')}
+      ${refEntries.map(([src, cnt]) => `<span style="margin-left:12px;color:var(--cyan)">${safeHtml(src)}</span> <span style="color:var(--text-dim)">(${cnt})</span>`).join('')}
     </div>
   ` : '';
 
@@ -2018,14 +2924,15 @@ function renderFunnel(d) {
             <th style="text-align:left; padding:6px 8px; color:var(--text-dim);">Last Seen</th>
           </tr></thead><tbody>`;
     for (const a of diag.challenged_agents.slice(0, 10)) {
-      const uaShort = a.user_agent.length > 40 ? a.user_agent.substring(0, 40) + '...' : a.user_agent;
+      const ua = String(a.user_agent);
+      const uaShort = safeHtml(ua.length > 40 ? ua.substring(0, 40) + '...' : ua);
       const typeColor = ['mcp_client','claude','openai','gemini'].includes(a.type) ? 'var(--green)' : 'var(--text)';
       html += `<tr style="border-bottom:1px solid var(--border);">
-        <td style="padding:6px 8px; font-family:monospace; font-size:11px;" title="${a.user_agent}">${uaShort}</td>
-        <td style="padding:6px 8px; color:${typeColor}; font-weight:600;">${a.type}</td>
+        <td style="padding:6px 8px; font-family:monospace; font-size:11px;" title="${safeHtml(ua)}">${uaShort}</td>
+        <td style="padding:6px 8px; color:${typeColor}; font-weight:600;">${safeVal(a.type)}</td>
         <td style="text-align:center; padding:6px 8px; font-weight:700; color:var(--yellow);">${a.challenges}</td>
-        <td style="padding:6px 8px; font-size:11px; color:var(--text-dim);">${a.first_seen ? new Date(a.first_seen).toLocaleDateString() : '?'}</td>
-        <td style="padding:6px 8px; font-size:11px; color:var(--text-dim);">${a.last_seen ? new Date(a.last_seen).toLocaleDateString() : '?'}</td>
+        <td style="padding:6px 8px; font-size:11px; color:var(--text-dim);">${a.first_seen ? DATE_FMT.format(new Date(a.first_seen)) : '?'}</td>
+        <td style="padding:6px 8px; font-size:11px; color:var(--text-dim);">${a.last_seen ? DATE_FMT.format(new Date(a.last_seen)) : '?'}</td>
       </tr>`;
     }
     html += `</tbody></table></div>`;
@@ -2073,12 +2980,12 @@ function renderErrorSummary() {
   };
 
   const recentRows = recent.slice(0, 10).map(e => {
-    const ts = e.timestamp ? new Date(e.timestamp).toLocaleTimeString([], {hour:'2-digit', minute:'2-digit'}) : '';
+    const ts = e.timestamp ? HOUR_MINUTE_FMT.format(new Date(e.timestamp)) : '';
     return `<div class="error-item">
       <span class="error-time">${ts}</span>
-      <span class="error-badge ${badgeClass(e.error_type)}">${(e.error_type || '').replace(/_/g, ' ')}</span>
-      <span class="error-src">${e.source || ''}</span>
-      <span class="error-msg">${e.message || ''}</span>
+      <span class="error-badge ${badgeClass(e.error_type)}">${spaced(e.error_type || '')}</span>
+      <span class="error-src">${safeVal(e.source || '')}</span>
+      <span class="error-msg">${safeVal(e.message || '')}</span>
     </div>`;
   }).join('');
 
@@ -2109,10 +3016,8 @@ function renderErrorSummary() {
 }
 
 function renderAnalytics() {
-  const content = document.getElementById('content');
-
   if (!analyticsData || analyticsData.total_requests === 0) {
-    content.innerHTML = `
+    setContent(`
       <div class="perf-collecting">
         <div class="pc-icon">&#128200;</div>
         <div class="pc-title">Usage Tracking Active</div>
@@ -2132,7 +3037,7 @@ function renderAnalytics() {
         <code>/mcp/sse</code> (MCP SSE) &middot;
         <code>/docs</code> (OpenAPI)
       </div>
-    `;
+    `);
     return;
   }
 
@@ -2163,17 +3068,17 @@ function renderAnalytics() {
     <div class="analytics-grid">
       <div class="analytics-card">
         <div class="ac-label">Total Requests (All Time)</div>
-        <div class="ac-value" style="color:var(--cyan)">${totalReqs.toLocaleString()}</div>
-        <div class="ac-sub">${intReqs.toLocaleString()} internal &middot; ${extReqs.toLocaleString()} external${unkReqs > 0 ? ' &middot; ' + unkReqs.toLocaleString() + ' unclassified' : ''}</div>
+        <div class="ac-value" style="color:var(--cyan)">${fmtInt(totalReqs)}</div>
+        <div class="ac-sub">${fmtInt(intReqs)} internal &middot; ${fmtInt(extReqs)} external${unkReqs > 0 ? ' &middot; ' + fmtInt(unkReqs) + ' unclassified' : ''}</div>
       </div>
       <div class="analytics-card">
         <div class="ac-label">Confirmed External</div>
-        <div class="ac-value" style="color:var(--green)">${extReqs.toLocaleString()}</div>
+        <div class="ac-value" style="color:var(--green)">${fmtInt(extReqs)}</div>
         <div class="ac-sub">${extClients} unique clients</div>
       </div>
       <div class="analytics-card">
         <div class="ac-label">External AI Agents</div>
-        <div class="ac-value" style="color:var(--purple, #a78bfa)">${extAiReqs.toLocaleString()}</div>
+        <div class="ac-value" style="color:var(--purple, #a78bfa)">${fmtInt(extAiReqs)}</div>
         <div class="ac-sub">${extReqs > 0 ? ((extAiReqs/extReqs)*100).toFixed(0) : 0}% of external traffic</div>
       </div>
       <div class="analytics-card">
@@ -2184,55 +3089,61 @@ function renderAnalytics() {
   `;
 
   // Client type breakdown
-  const typeEntries = Object.entries(byType).sort((a,b) => b[1] - a[1]);
-  const typeCards = typeEntries.map(([type, count]) => {
+  const typeEntries = sortedEntries(byType, byCountDesc);
+  let typeCards = '';
+  for (const [type, count] of typeEntries) {
     const isAI = aiTypes.includes(type);
-    return `
+    typeCards += `
       <div class="ua-chip ${isAI ? 'ai-agent' : ''}">
-        <span class="ua-name">${type.replace(/_/g, ' ')}</span>
+        <span class="ua-name">${spaced(type)}</span>
         <span class="ua-count">${count}</span>
       </div>`;
-  }).join('');
+  }
 
   // Daily chart
-  const dayEntries = Object.entries(perDay).sort((a,b) => a[0].localeCompare(b[0]));
-  const maxDay = Math.max(...dayEntries.map(e => e[1]), 1);
-  const dailyBars = dayEntries.map(([day, count]) => {
-    const pct = (count / maxDay) * 100;
-    const shortDay = day.slice(5); // MM-DD
-    return `
-      <div class="daily-bar-wrap">
-        <div class="daily-bar-count">${count}</div>
-        <div class="daily-bar" style="height:${Math.max(pct, 2)}%"></div>
-        <div class="daily-bar-label">${shortDay}</div>
-      </div>`;
-  }).join('');
+  const dayEntries = sortedEntries(perDay, (a,b) => a[0].localeCompare(b[0]));
+  let maxDay = 1;
+  for (const [, count] of dayEntries) if (count > maxDay) maxDay = count;
+  // Bars are drawn by the worker when it can; only the day labels are DOM.
+  const canvasChart = dayEntries.length && canDrawCharts();
+  let dailyBars = '';
+  if (canvasChart) {
+    for (const [day] of dayEntries) {
+      dailyBars += `<span><span class="daily-bar-label">${safeHtml(day.slice(5))}</span></span>`;
+    }
+    dailyBars = `<canvas class="daily-canvas"></canvas><div class="daily-labels">${dailyBars}</div>`;
+  } else if (dayEntries.length) {
+    dailyBars = `<div class="daily-bars">${dailyBarsHtml(dayEntries, maxDay)}</div>`;
+  }
 
   // Endpoint breakdown table
-  const epEntries = Object.entries(byEndpoint).sort((a,b) => b[1] - a[1]);
-  const maxEp = Math.max(...epEntries.map(e => e[1]), 1);
-  const epRows = epEntries.map(([ep, count]) => {
+  const epEntries = sortedEntries(byEndpoint, byCountDesc);
+  const maxEp = Math.max(epEntries[0]?.[1] || 0, 1); // sorted by count, desc
+  let epRows = '';
+  for (const [ep, count] of epEntries) {
     const pct = (count / maxEp) * 100;
-    return `<tr>
-      <td><code>${ep}</code></td>
+    epRows += `<tr>
+      <td><code>${safeHtml(ep)}</code></td>
       <td style="font-weight:700">${count}</td>
       <td style="width:40%">
         <div class="ep-bar-bg"><div class="ep-bar" style="width:${pct}%"></div></div>
       </td>
     </tr>`;
-  }).join('');
+  }
 
   // Top user agents table
-  const uaRows = topUAs.slice(0, 15).map(ua => {
+  let uaRows = '';
+  for (let i = 0, n = Math.min(topUAs.length, 15); i < n; i++) {
+    const ua = topUAs[i];
     const isAI = aiTypes.includes(ua.type);
-    return `<tr>
-      <td style="font-size:12px;word-break:break-all;max-width:400px">${ua.user_agent || 'unknown'}</td>
-      <td><span class="dir-badge ${isAI ? 'bullish' : 'neutral'}">${ua.type.replace(/_/g, ' ').toUpperCase()}</span></td>
+    uaRows += `<tr>
+      <td style="font-size:12px;word-break:break-all;max-width:400px">${safeVal(ua.user_agent || 'unknown')}</td>
+      <td><span class="dir-badge ${isAI ? 'bullish' : 'neutral'}">${spaced(ua.type).toUpperCase()}</span></td>
       <td style="font-weight:700">${ua.requests}</td>
     </tr>`;
-  }).join('');
+  }
 
-  content.innerHTML = `
+  setContent(`
     ${summaryCards}
 
     ${renderAttribution(d)}
@@ -2245,7 +3156,7 @@ function renderAnalytics() {
 
     <div class="perf-section-title">Requests Per Day</div>
     <div class="daily-chart">
-      <div class="daily-bars">${dailyBars || '<span style="color:var(--text-dim);padding:20px">No daily data yet</span>'}</div>
+      ${dailyBars || '<div class="daily-bars"><span style="color:var(--text-dim);padding:20px">No daily data yet</span></div>'}
     </div>
 
     <div class="perf-section-title">Endpoint Popularity</div>
@@ -2280,7 +3191,48 @@ function renderAnalytics() {
       <strong>Client Classification:</strong> User-agents are classified as AI agent (Claude, OpenAI, Gemini, LangChain, CrewAI, MCP),
       SDK (Python, Node.js, curl), browser, or bot. AI agent requests are highlighted in green.
     </div>
-  `;
+  `);
+  if (canvasChart) drawDailyChart(contentEl.querySelector('.daily-chart'), dayEntries, maxDay);
+}
+
+function dailyBarsHtml(dayEntries, maxDay) {
+  let html = '';
+  for (const [day, count] of dayEntries) {
+    const pct = (count / maxDay) * 100;
+    const shortDay = safeHtml(day.slice(5)); // MM-DD
+    html += `
+      <div class="daily-bar-wrap">
+        <div class="daily-bar-count">${count}</div>
+        <div class="daily-bar" style="height:${Math.max(pct, 2)}%"></div>
+        <div class="daily-bar-label">${shortDay}</div>
+      </div>`;
+  }
+  return html;
+}
+
+// The daily chart is rasterized in the JSON worker on an OffscreenCanvas and
+// handed back as an ImageBitmap: one blit instead of a styled element per day.
+function canDrawCharts() {
+  return !!jsonWorker && !!window.OffscreenCanvas && !!window.ImageBitmapRenderingContext;
+}
+
+function drawDailyChart(chart, dayEntries, maxDay) {
+  const canvas = chart.querySelector('.daily-canvas');
+  const w = canvas.clientWidth, h = canvas.clientHeight;
+  const dpr = window.devicePixelRatio || 1;
+  canvas.width = Math.round(w * dpr);
+  canvas.height = Math.round(h * dpr);
+  const css = getComputedStyle(document.documentElement);
+  workerRequest({ chart: {
+    w, h, dpr, max: maxDay,
+    values: dayEntries.map(e => e[1]),
+    bar: css.getPropertyValue('--cyan').trim(),
+    text: css.getPropertyValue('--text-dim').trim(),
+  } }).then(
+    ({ bitmap }) => canvas.getContext('bitmaprenderer').transferFromImageBitmap(bitmap),
+    // worker couldn't draw: fall back to DOM bars
+    () => { chart.innerHTML = `<div class="daily-bars">${dailyBarsHtml(dayEntries, maxDay)}</div>`; },
+  );
 }
 
 function renderAgentIntelligence() {
@@ -2323,15 +3275,16 @@ function renderAgentIntelligence() {
   // Daily trend mini-chart
   const trend = growth.daily_trend || [];
   if (trend.length > 1) {
-    const maxR = Math.max(...trend.map(t => t.requests), 1);
+    let maxR = 1;
+    for (const t of trend) if (t.requests > maxR) maxR = t.requests;
     html += `<div style="display:flex; align-items:flex-end; gap:2px; height:60px; margin-bottom:16px;">`;
     for (const t of trend) {
       const pct = (t.requests / maxR) * 100;
-      html += `<div style="flex:1; background:var(--cyan); opacity:0.7; border-radius:2px 2px 0 0; height:${Math.max(pct, 2)}%;" title="${t.date}: ${t.requests} reqs, ${t.unique_agents} agents"></div>`;
+      html += `<div style="flex:1; background:var(--cyan); opacity:0.7; border-radius:2px 2px 0 0; height:${Math.max(pct, 2)}%;" title="${safeVal(t.date)}: ${t.requests} reqs, ${t.unique_agents} agents"></div>`;
     }
     html += `</div>
       <div style="font-size:10px; color:var(--text-dim); display:flex; justify-content:space-between;">
-        <span>${trend[0]?.date || ''}</span><span>Daily External Requests</span><span>${trend[trend.length-1]?.date || ''}</span>
+        <span>${safeVal(trend[0]?.date || '')}</span><span>Daily External Requests</span><span>${safeVal(trend[trend.length-1]?.date || '')}</span>
       </div>`;
   }
 
@@ -2353,25 +3306,26 @@ function renderAgentIntelligence() {
           <th style="text-align:left; padding:6px 8px; color:var(--text-dim);">Last Seen</th>
         </tr></thead><tbody>`;
     for (const a of agents.slice(0, 20)) {
-      const uaShort = a.user_agent.length > 50 ? a.user_agent.substring(0, 50) + '...' : a.user_agent;
+      const ua = String(a.user_agent);
+      const uaShort = safeHtml(ua.length > 50 ? ua.substring(0, 50) + '...' : ua);
       const isAI = aiTypes.includes(a.type);
       const typeColor = isAI ? 'var(--green)' : 'var(--text)';
       html += `<tr style="border-bottom:1px solid var(--border);">
-        <td style="padding:6px 8px; font-family:monospace; font-size:11px; max-width:300px; word-break:break-all;" title="${a.user_agent}">${uaShort}</td>
-        <td style="padding:6px 8px; color:${typeColor}; font-weight:600; font-size:11px;">${a.type}</td>
+        <td style="padding:6px 8px; font-family:monospace; font-size:11px; max-width:300px; word-break:break-all;" title="${safeHtml(ua)}">${uaShort}</td>
+        <td style="padding:6px 8px; color:${typeColor}; font-weight:600; font-size:11px;">${safeVal(a.type)}</td>
         <td style="text-align:center; padding:6px 8px; font-weight:700;">${a.total_requests}</td>
         <td style="text-align:center; padding:6px 8px;">${a.unique_endpoints}</td>
         <td style="text-align:center; padding:6px 8px; color:${a.challenges_402 > 0 ? 'var(--yellow)' : 'var(--text-dim)'};">${a.challenges_402}</td>
         <td style="text-align:center; padding:6px 8px; color:${a.paid_calls > 0 ? 'var(--green)' : 'var(--text-dim)'};">${a.paid_calls}</td>
-        <td style="padding:6px 8px; font-size:11px; color:var(--text-dim);">${a.first_seen ? new Date(a.first_seen).toLocaleDateString() : '?'}</td>
-        <td style="padding:6px 8px; font-size:11px; color:var(--text-dim);">${a.last_seen ? new Date(a.last_seen).toLocaleDateString() : '?'}</td>
+        <td style="padding:6px 8px; font-size:11px; color:var(--text-dim);">${a.first_seen ? DATE_FMT.format(new Date(a.first_seen)) : '?'}</td>
+        <td style="padding:6px 8px; font-size:11px; color:var(--text-dim);">${a.last_seen ? DATE_FMT.format(new Date(a.last_seen)) : '?'}</td>
       </tr>`;
     }
     html += `</tbody></table></div>`;
   }
 
   // Endpoint interest
-  const epEntries = Object.entries(epInterest).sort((a,b) => b[1] - a[1]).slice(0, 10);
+  const epEntries = sortedEntries(epInterest, byCountDesc).slice(0, 10);
   if (epEntries.length) {
     const maxEp = epEntries[0][1] || 1;
     html += `
@@ -2379,7 +3333,7 @@ function renderAgentIntelligence() {
     for (const [ep, count] of epEntries) {
       const pct = (count / maxEp) * 100;
       html += `<div style="display:flex; align-items:center; gap:10px; margin-bottom:4px;">
-        <code style="font-size:12px; min-width:200px;">${ep}</code>
+        <code style="font-size:12px; min-width:200px;">${safeHtml(ep)}</code>
         <div style="flex:1; background:var(--surface2); border-radius:4px; height:18px; overflow:hidden;">
           <div style="background:var(--cyan); height:100%; width:${pct}%; border-radius:4px;"></div>
         </div>
@@ -2392,11 +3346,323 @@ function renderAgentIntelligence() {
   return html;
 }
 
-// Initial load
-fetchAll();
+// Auto-refresh: every 60s while the tab is visible, backing off (x1.5, up to
+// 5 min) while nothing changes: no signal push since the last tick and no
+// polled payload touched. Analytics doesn't count, since the polls themselves
+// move its request totals. Hidden tabs don't poll; coming back resumes the
+// 60s cadence.
+const REFRESH_MIN = 60000;
+const REFRESH_MAX = 300000;
+let refreshDelay = REFRESH_MIN;
+let refreshTimer = null;
+let lastRefresh = Date.now();
+let pushesSeen = 0;
+
+function scheduleRefresh(ms) {
+  clearTimeout(refreshTimer);
+  refreshTimer = setTimeout(refreshTick, ms);
+}
+
+async function refreshTick() {
+  refreshTimer = null;
+  if (document.visibilityState === 'hidden') return; // resumed on visibilitychange
+  lastRefresh = Date.now();
+  const touched = await fetchAll(true);
+  const active = signalPushes !== pushesSeen
+    || [...(touched || [])].some(source => source !== 'analytics');
+  pushesSeen = signalPushes;
+  refreshDelay = active ? REFRESH_MIN : Math.min(refreshDelay * 1.5, REFRESH_MAX);
+  scheduleRefresh(refreshDelay);
+}
+
+document.addEventListener('visibilitychange', () => {
+  if (document.visibilityState === 'hidden') return;
+  refreshDelay = REFRESH_MIN;
+  scheduleRefresh(Math.max(0, lastRefresh + REFRESH_MIN - Date.now()));
+});
 
-// Auto-refresh every 60s
-setInterval(fetchAll, 60000);
+// Initial load: paint the session's last snapshot, if any, then revalidate.
+restoreBootSnapshot();
+fetchAll();
+scheduleRefresh(REFRESH_MIN);
 </script>
 </body>
 </html>"""
+
+# Fetch + JSON.parse off the main thread. Served same-origin from /static (a
+# blob: worker would send no Referer, which the internal endpoints require).
+# Each request brings its own MessagePort for the reply. The worker also
+# parses SSE snapshots handed to it as text and rasterizes the analytics
+# daily chart on an OffscreenCanvas.
+DASHBOARD_WORKER_JS = """function drawChart({ w, h, dpr, values, max, bar, text }) {
+  const c = new OffscreenCanvas(Math.round(w * dpr), Math.round(h * dpr));
+  const g = c.getContext('2d');
+  g.scale(dpr, dpr);
+  const slot = w / values.length;
+  const bw = Math.max(1, Math.min(40, slot - 4));
+  const room = h - 14; // space above the tallest bar for its count
+  g.font = '10px sans-serif';
+  g.textAlign = 'center';
+  g.textBaseline = 'bottom';
+  values.forEach((v, i) => {
+    const bh = Math.max(2, (v / max) * room);
+    const x = i * slot + (slot - bw) / 2;
+    g.fillStyle = bar;
+    g.fillRect(x, h - bh, bw, bh);
+    g.fillStyle = text;
+    g.fillText(String(v), x + bw / 2, h - bh - 2);
+  });
+  return c.transferToImageBitmap();
+}
+
+const lastBodies = new Map();
+
+self.onmessage = async (e) => {
+  const port = e.ports[0];
+  if (e.data.parse !== undefined) {
+    try {
+      port.postMessage({ data: JSON.parse(e.data.parse) });
+    } catch (err) {
+      port.postMessage({ error: String((err && err.message) || err) });
+    }
+    return;
+  }
+  if (e.data.chart) {
+    try {
+      const bitmap = drawChart(e.data.chart);
+      port.postMessage({ bitmap }, [bitmap]);
+    } catch (err) {
+      port.postMessage({ error: String((err && err.message) || err) });
+    }
+    return;
+  }
+  try {
+    const r = await fetch(e.data.url, { credentials: 'same-origin' });
+    const text = await r.text();
+    if (r.ok && lastBodies.get(e.data.url) === text) {
+      port.postMessage({ ok: true, status: r.status, unchanged: true });
+      return;
+    }
+    if (r.ok) lastBodies.set(e.data.url, text);
+    let data = null;
+    try { data = JSON.parse(text); } catch (err) { if (r.ok) throw err; }
+    port.postMessage({ ok: r.ok, status: r.status, data });
+  } catch (err) {
+    port.postMessage({ error: String((err && err.message) || err) });
+  }
+};
+"""
+
+
+# ---------------------------------------------------------------------------
+# Pre-minified, pre-compressed payloads (built once at import)
+# ---------------------------------------------------------------------------
+_SCRIPT_RE = re.compile(r"(<script>.*?</script>)", re.S)
+_STYLE_RE = re.compile(r"<style>(.*?)</style>", re.S)
+_SCRIPT_BODY_RE = re.compile(r"<script>(.*?)</script>", re.S)
+
+
+def _minify_css(css: str) -> str:
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s*([{};,])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.strip()
+
+
+def _minify(html: str) -> str:
+    """Strip comments and collapse whitespace in markup.
+
+    Everything between <script> and </script> is left untouched — regex
+    minification isn't safe for JS, and compression absorbs its whitespace.
+    """
+    parts = _SCRIPT_RE.split(html)
+    for i in range(0, len(parts), 2):  # even indices are outside <script>
+        markup = re.sub(r"<!--.*?-->", "", parts[i], flags=re.S)
+        parts[i] = re.sub(r"\s+", " ", markup)
+    return "".join(parts)
+
+
+def _encode(body: bytes, quality: int = 11) -> Dict[str, bytes]:
+    """Precompute every Content-Encoding we serve for `body`.
+
+    `quality` is the Brotli level: 11 for build-once assets, lower for
+    payloads re-encoded at runtime.
+    """
+    variants = {"identity": body, "gzip": gzip.compress(body, 9 if quality >= 9 else 6)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(body, quality=quality, mode=brotli.MODE_TEXT)
+    return variants
+
+
+def _accepts(accept_encoding: str, coding: str) -> bool:
+    """True if `coding` is listed in Accept-Encoding without q=0."""
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.partition(";")
+        if name.strip() == coding:
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def _coding(variants: Dict[str, object], accept_encoding: str) -> str:
+    """Best available coding the client accepts: br > gzip > identity."""
+    for coding in ("br", "gzip"):
+        if coding in variants and _accepts(accept_encoding, coding):
+            return coding
+    return "identity"
+
+
+def _pick(variants: Dict[str, bytes], accept_encoding: str) -> Tuple[bytes, Dict[str, str]]:
+    """Choose br > gzip > identity and build the matching headers."""
+    coding = _coding(variants, accept_encoding)
+    body = variants[coding]
+    headers = {"Vary": "Accept-Encoding", "Content-Length": str(len(body))}
+    if coding != "identity":
+        headers["Content-Encoding"] = coding
+    return body, headers
+
+
+def _encode_chunks(chunks: Tuple[bytes, ...]) -> Dict[str, Tuple[bytes, ...]]:
+    """Like _encode, but each chunk is flushed on its own.
+
+    The compressed pieces concatenate to one valid stream, and the browser
+    can decode (and act on) each piece as soon as it arrives.
+    """
+    gz = zlib.compressobj(9, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+    *head, last = chunks
+    variants = {
+        "identity": tuple(chunks),
+        "gzip": tuple(gz.compress(c) + gz.flush(zlib.Z_SYNC_FLUSH) for c in head)
+        + (gz.compress(last) + gz.flush(),),
+    }
+    if brotli is not None:
+        br = brotli.Compressor(quality=11, mode=brotli.MODE_TEXT)
+        variants["br"] = tuple(br.process(c) + br.flush() for c in head) + (br.process(last) + br.finish(),)
+    return variants
+
+
+# Hashed static assets: filename -> (etag, encoded variants, content type).
+# The URL carries the content hash, so every asset is cached as immutable.
+_STATIC: Dict[str, Tuple[str, Dict[str, bytes], str]] = {}
+
+
+def _register_static(stem: str, ext: str, text: str, content_type: str) -> str:
+    """Register `text` under a content-hashed /static URL and return the URL."""
+    body = text.encode("utf-8")
+    digest = hashlib.sha1(body).hexdigest()[:10]
+    filename = f"{stem}.{digest}.{ext}"
+    _STATIC[filename] = (f'"{digest}"', _encode(body), content_type)
+    return f"/static/{filename}"
+
+
+# CSS and JS move out to content-hashed, immutable assets so repeat visits
+# only re-download the HTML shell.
+DASHBOARD_CSS: str = _minify_css(_STYLE_RE.search(DASHBOARD_HTML).group(1))
+CSS_HREF: str = _register_static("dashboard", "css", DASHBOARD_CSS, "text/css; charset=utf-8")
+WORKER_HREF: str = _register_static(
+    "dashboard-worker", "js", DASHBOARD_WORKER_JS, "text/javascript; charset=utf-8"
+)
+DASHBOARD_JS: str = _SCRIPT_BODY_RE.search(DASHBOARD_HTML).group(1).replace(
+    "__JSON_WORKER_URL__", WORKER_HREF
+)
+JS_HREF: str = _register_static("dashboard", "js", DASHBOARD_JS, "text/javascript; charset=utf-8")
+
+# A classic (non-module) deferred script: the inline on* handlers still see
+# its top-level functions, and it runs once the markup has been parsed,
+# exactly where the inline block used to.
+DASHBOARD_HTML_SHELL: str = _SCRIPT_BODY_RE.sub(
+    lambda _: f'<script src="{JS_HREF}" defer></script>',
+    _STYLE_RE.sub(lambda _: f'<link rel="stylesheet" href="{CSS_HREF}">', DASHBOARD_HTML, count=1),
+    count=1,
+)
+
+
+def _split_html(html: str) -> Tuple[bytes, ...]:
+    """<head> / body markup / <script>…</html>, sent as separate chunks."""
+    head_end = html.index("</head>") + len("</head>")
+    script_start = html.index("<script", head_end)
+    return tuple(
+        part.encode("utf-8")
+        for part in (html[:head_end], html[head_end:script_start], html[script_start:])
+    )
+
+
+_HTML_CHUNKS = _split_html(_minify(DASHBOARD_HTML_SHELL))
+_HTML_VARIANTS = _encode_chunks(_HTML_CHUNKS)
+_HTML_ETAG: str = '"' + hashlib.sha1(b"".join(_HTML_CHUNKS)).hexdigest()[:16] + '"'
+
+# Lets the browser (and any CDN in front) start fetching the stylesheet and
+# script as soon as the response headers arrive, before the HTML is parsed.
+# The first data request is preloaded too: /api/bootstrap is cacheable for a
+# few seconds, so the script's own fetch is answered from the HTTP cache
+# instead of starting a second round trip after the page has loaded.
+_LINK_HEADER: str = ", ".join((
+    f"<{CSS_HREF}>; rel=preload; as=style",
+    f"<{JS_HREF}>; rel=preload; as=script",
+    "</api/bootstrap>; rel=preload; as=fetch; crossorigin",
+))
+
+
+def dashboard_response(
+    accept_encoding: str, if_none_match: str = ""
+) -> Tuple[int, Tuple[bytes, ...], Dict[str, str]]:
+    """Pick the pre-built dashboard chunks for a request's Accept-Encoding.
+
+    Prefers br > gzip > identity and returns (status, body chunks, headers);
+    the chunks (head, markup, script) are meant to be streamed, so no
+    Content-Length is set. The shell is revalidated rather than cached
+    outright — it names the hashed assets of the running build — and a
+    matching If-None-Match gets an empty 304.
+    """
+    headers = {"ETag": _HTML_ETAG, "Cache-Control": "no-cache"}
+    if _HTML_ETAG in if_none_match or if_none_match.strip() == "*":
+        return 304, (), headers
+    coding = _coding(_HTML_VARIANTS, accept_encoding)
+    headers.update({"Vary": "Accept-Encoding", "Link": _LINK_HEADER})
+    if coding != "identity":
+        headers["Content-Encoding"] = coding
+    return 200, _HTML_VARIANTS[coding], headers
+
+
+def static_response(
+    filename: str, accept_encoding: str, if_none_match: str
+) -> Tuple[int, bytes, Dict[str, str]]:
+    """Serve a registered /static asset: (status, body, headers).
+
+    A matching If-None-Match short-circuits to an empty 304. Unknown
+    filenames (e.g. a hash from an HTML shell before a deploy) get a 404.
+    """
+    asset = _STATIC.get(filename)
+    if asset is None:
+        return 404, b"", {}
+    etag, variants, content_type = asset
+    status, body, headers = conditional_response(etag, variants, accept_encoding, if_none_match)
+    headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    if status == 200:
+        headers["Content-Type"] = content_type
+    return status, body, headers
+
+
+def precompress_json(body: bytes) -> Tuple[str, Dict[str, bytes]]:
+    """ETag and encoded variants for a runtime JSON payload.
+
+    Uses a fast Brotli level since this runs once per new snapshot rather
+    than once per process.
+    """
+    etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+    return etag, _encode(body, quality=5)
+
+
+def conditional_response(
+    etag: str, variants: Dict[str, bytes], accept_encoding: str, if_none_match: str
+) -> Tuple[int, bytes, Dict[str, str]]:
+    """(status, body, headers) for a pre-encoded entity.
+
+    An If-None-Match naming `etag` gets an empty 304; otherwise the best
+    encoding the client accepts, with ETag / Vary / Content-Encoding set.
+    """
+    headers = {"ETag": etag}
+    if etag in if_none_match or if_none_match.strip() == "*":
+        return 304, b"", headers
+    body, enc_headers = _pick(variants, accept_encoding)
+    headers.update(enc_headers)
+    return 200, body, headers
@@ -10,6 +10,7 @@ Endpoints:
     GET /performance/{asset}        Per-asset accuracy breakdown
     GET /analytics                  API usage analytics (user-agents, requests/day)
     GET /api/signal                 Internal free signal endpoint (dashboard)
+    GET /api/signal/stream          Internal SSE push of signal updates (dashboard)
     GET /api/performance/reputation Internal free reputation endpoint (dashboard)
     POST /admin/reset-accuracy      Reset tainted accuracy data (admin token required)
     GET /.well-known/agent.json     A2A agent discovery card
@@ -21,8 +22,10 @@ from __future__ import annotations
 
 import asyncio
 import concurrent.futures
+import json
 import logging
 import os
+import tempfile
 import threading
 import time
 import traceback
@@ -32,12 +35,17 @@ from typing import Any, Dict, Optional
 
 from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, PlainTextResponse, StreamingResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from shared.storage import Storage
 from signal_fusion.engine import SignalFusion
-from api.dashboard import DASHBOARD_HTML
+from api.dashboard import conditional_response, dashboard_response, precompress_json, static_response
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json fallback
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Logging — structured output for Railway
@@ -169,20 +177,9 @@ if _X402_ENABLED:
         logger.warning("x402: Bazaar extension not available — skipping discovery")
         declare_discovery_extension = None
 
-    # Eagerly initialize: connect to facilitator NOW, not on first request.
-    # If facilitator is unreachable, keep x402 enabled but mark as pending retry.
-    # A background task will retry initialization periodically.
-    _x402_init_pending = False
-    try:
-        _x402_server.initialize()
-        logger.info("x402: facilitator OK (%s)", _X402_FACILITATOR_URL)
-    except Exception as _init_exc:
-        _x402_init_error = str(_init_exc)
-        logger.error("x402: FACILITATOR INIT FAILED — %s", _init_exc)
-        logger.warning("x402: will retry facilitator init every 60s in background")
-        _x402_init_pending = True
-        # Keep _X402_ENABLED = True but mark pending so middleware knows
-        # The server still comes up, routes are gated, retry happens in background
+    # Building the client and server is configuration only; the facilitator
+    # is first contacted by _x402_initialize() in the lifespan, i.e. in each
+    # serving process rather than a pre-fork gunicorn master.
 
 if _X402_ENABLED:
     # Route patterns: x402 uses glob syntax (* for wildcards, not {param})
@@ -529,6 +526,147 @@ if _X402_ENABLED:
     logger.info("x402: configured %d paid routes (pay_to=%s...)", len(_x402_routes), _PAY_TO[:10])
 
 
+# ---------------------------------------------------------------------------
+# Live signal push — SSE subscribers fed by the orchestrator
+# ---------------------------------------------------------------------------
+_event_loop: Optional[asyncio.AbstractEventLoop] = None  # set in lifespan
+_signal_subscribers: set = set()  # one asyncio.Queue per /api/signal/stream client
+
+
+def _publish_signal(result: Dict[str, Any]) -> None:
+    """Hand a fresh fusion result to the event loop (orchestrator thread)."""
+    loop = _event_loop
+    if loop is not None and not loop.is_closed():
+        loop.call_soon_threadsafe(_fanout_signal, result)
+
+
+def _fanout_signal(result: Dict[str, Any]) -> None:
+    """Refresh the signal cache and queue the result for every stream client."""
+    global _cached_result, _cache_timestamp
+    _cached_result = result
+    _cache_timestamp = datetime.now(timezone.utc).isoformat()
+    for q in list(_signal_subscribers):
+        if q.full():  # slow client: only the newest snapshot matters
+            q.get_nowait()
+        q.put_nowait(result)
+
+
+def _signal_delta(prev: Dict[str, Any], cur: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Changed top-level data keys and per-asset signals between two results."""
+    prev_data, cur_data = prev.get("data") or {}, cur.get("data") or {}
+    prev_sigs, cur_sigs = prev_data.get("signals") or {}, cur_data.get("signals") or {}
+
+    data = {k: v for k, v in cur_data.items() if k != "signals" and prev_data.get(k) != v}
+    signals = {a: s for a, s in cur_sigs.items() if prev_sigs.get(a) != s}
+    removed = [a for a in prev_sigs if a not in cur_sigs]
+    if not (data or signals or removed):
+        return None
+    return {
+        "timestamp": cur.get("timestamp"),
+        "data": data,
+        "signals": signals,
+        "removed": removed,
+    }
+
+
+# Dashboard sort keys → per-signal accessor (mirrors the dashboard's columns)
+_DASHBOARD_SORTS = {
+    "asset": None,
+    "score": lambda s: s.get("composite_score") or 0,
+    **{
+        dim: (lambda s, dim=dim: ((s.get("dimensions") or {}).get(dim) or {}).get("score") or 0)
+        for dim in ("whale", "technical", "derivatives", "narrative", "market", "trend")
+    },
+}
+# (result key, view, encoded view, (etag, compressed variants))
+_dashboard_view_cache: tuple = (None, None, None, None)
+
+
+def _result_key(result: Dict[str, Any]) -> Any:
+    """Cache key for a fusion result: its timestamp.
+
+    get_signal reloads the latest run from storage as a fresh dict every
+    CACHE_TTL_SEC, so object identity would miss on unchanged data. A result
+    without a timestamp is keyed by its content.
+    """
+    return result.get("timestamp") or result
+
+
+def _dumps(obj: Any) -> bytes:
+    """JSON-encode for the dashboard feeds — orjson when installed.
+
+    Output matches ``json.dumps(obj, default=str)``: numpy values serialize
+    natively, datetimes and other unknown types fall back to ``str()``.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    return json.dumps(obj, default=str, separators=(",", ":")).encode("utf-8")
+
+
+def _dashboard_view(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Fusion result plus ``data.sorted_views`` for the dashboard.
+
+    ``sorted_views["<field>_<asc|desc>"]`` lists assets in display order, so
+    the browser indexes instead of re-sorting. Built once per result; the
+    paid /signal payload is left untouched (shallow copy).
+    """
+    global _dashboard_view_cache
+    cache_key = _result_key(result)
+    if _dashboard_view_cache[0] == cache_key:
+        return _dashboard_view_cache[1]
+
+    data = result.get("data") or {}
+    signals = data.get("signals") or {}
+    views: Dict[str, list] = {}
+    for field, key in _DASHBOARD_SORTS.items():
+        if key is None:
+            asc = sorted(signals)
+            desc = asc[::-1]
+        else:
+            # sorted() is stable, so ties keep payload order in both directions
+            sort_key = lambda a, key=key: key(signals[a])  # noqa: E731
+            asc = sorted(signals, key=sort_key)
+            desc = sorted(signals, key=sort_key, reverse=True)
+        views[f"{field}_asc"] = asc
+        views[f"{field}_desc"] = desc
+
+    view = {**result, "data": {**data, "sorted_views": views}}
+    _dashboard_view_cache = (cache_key, view, None, None)
+    return view
+
+
+def _dashboard_body(result: Dict[str, Any]) -> bytes:
+    """Encoded ``_dashboard_view(result)``, serialized once per result."""
+    global _dashboard_view_cache
+    view = _dashboard_view(result)
+    body = _dashboard_view_cache[2]
+    if body is None:
+        body = _dumps(view)
+        _dashboard_view_cache = (_dashboard_view_cache[0], view, body, None)
+    return body
+
+
+def _dashboard_entity(result: Dict[str, Any]) -> tuple:
+    """(etag, {coding: bytes}) for the dashboard view, compressed once per result."""
+    global _dashboard_view_cache
+    body = _dashboard_body(result)
+    entity = _dashboard_view_cache[3]
+    if entity is None:
+        entity = precompress_json(body)
+        _dashboard_view_cache = (*_dashboard_view_cache[:3], entity)
+    return entity
+
+
+def _sse(event: str, payload: Dict[str, Any], body: Optional[bytes] = None) -> str:
+    event_id = payload.get("timestamp") or ""
+    data = (body if body is not None else _dumps(payload)).decode()
+    return f"id: {event_id}\nevent: {event}\ndata: {data}\n\n"
+
+
 # ---------------------------------------------------------------------------
 # Background orchestrator — runs all agents every N seconds
 # ---------------------------------------------------------------------------
@@ -648,6 +786,7 @@ def _orchestrator_loop(store: Storage, interval: int) -> None:
                 fusion = SignalFusion()
                 fusion_result = fusion.fuse()
                 store.save("signal_fusion", fusion_result)
+                _publish_signal(fusion_result)
                 f_status = fusion_result.get("status", "unknown")
                 f_ms = fusion_result.get("meta", {}).get("duration_ms", 0)
                 logger.info("  signal_fusion: %s (%sms)", f_status, f_ms)
@@ -711,6 +850,73 @@ def _orchestrator_loop(store: Storage, interval: int) -> None:
             time.sleep(1)
 
 
+# One process runs the agents. Under gunicorn every worker runs the lifespan,
+# so the workers race for an exclusive lock on this file; the others follow
+# the owner's results through storage.
+_ORCHESTRATOR_LOCK_FILE = os.getenv(
+    "ORCHESTRATOR_LOCK_FILE",
+    os.path.join(tempfile.gettempdir(), "web3signals-orchestrator.lock"),
+)
+_ORCHESTRATOR_FOLLOW_SEC = 30
+_orchestrator_lock = None  # open lock file, held for the life of the owner
+
+
+def _claim_orchestrator() -> bool:
+    """Take the orchestrator lock without blocking; True if this process owns it.
+
+    The kernel drops the lock when its process exits, so a restarted worker
+    (or a replacement deploy on the same host) can take over.
+    """
+    global _orchestrator_lock
+    if _orchestrator_lock is not None:
+        return True
+    try:
+        import fcntl
+    except ImportError:  # Windows: no gunicorn, so this is the only process
+        _orchestrator_lock = True
+        return True
+    try:
+        f = open(_ORCHESTRATOR_LOCK_FILE, "a")
+    except OSError as exc:
+        logger.warning("Orchestrator lock unavailable (%s) — running agents here", exc)
+        _orchestrator_lock = True
+        return True
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        f.close()
+        return False
+    _orchestrator_lock = f
+    return True
+
+
+def _orchestrator_main(store: Storage, interval: int) -> None:
+    """Background thread: run the orchestrator here, or follow the process that does.
+
+    A follower polls storage for new fusion results and publishes them, so
+    its own SSE clients and signal cache stay current, and claims the lock
+    as soon as the owner goes away.
+    """
+    last_seen = None
+    while _orchestrator_running and not _claim_orchestrator():
+        try:
+            latest = store.load_latest("signal_fusion")
+        except Exception as exc:
+            logger.warning("Orchestrator follower: load failed — %s", exc)
+            latest = None
+        if latest and latest.get("timestamp") != last_seen:
+            last_seen = latest.get("timestamp")
+            _publish_signal(latest)
+        for _ in range(_ORCHESTRATOR_FOLLOW_SEC):
+            if not _orchestrator_running:
+                return
+            time.sleep(1)
+
+    if _orchestrator_running:
+        logger.info("Orchestrator: this process (pid %s) runs the agents", os.getpid())
+        _orchestrator_loop(store, interval)
+
+
 def _record_performance_snapshot(store: Storage) -> int:
     """
     Record performance snapshots — one per asset per 12 hours.
@@ -1044,6 +1250,25 @@ def _run_perf_pipeline(store: Storage) -> bool:
 # ---------------------------------------------------------------------------
 # Lifespan — startup / shutdown
 # ---------------------------------------------------------------------------
+def _x402_initialize() -> None:
+    """Eagerly connect to the facilitator: at startup, not on first request.
+
+    If the facilitator is unreachable, x402 stays enabled but is marked
+    pending, and the lifespan starts _x402_retry_loop to try again.
+    """
+    global _x402_init_error, _x402_init_pending
+    try:
+        _x402_server.initialize()
+        logger.info("x402: facilitator OK (%s)", _X402_FACILITATOR_URL)
+    except Exception as exc:
+        _x402_init_error = str(exc)
+        logger.error("x402: FACILITATOR INIT FAILED — %s", exc)
+        logger.warning("x402: will retry facilitator init every 60s in background")
+        # Keep _X402_ENABLED = True but mark pending so middleware knows
+        # The server still comes up, routes are gated, retry happens in background
+        _x402_init_pending = True
+
+
 def _x402_retry_loop():
     """Background thread that retries x402 facilitator initialization every 60s."""
     global _X402_ENABLED, _x402_server, _x402_init_error, _x402_init_pending
@@ -1071,17 +1296,18 @@ def _x402_retry_loop():
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global _store, _fusion, _boot_time, _orchestrator_thread, _orchestrator_running
+    global _store, _fusion, _boot_time, _orchestrator_thread, _orchestrator_running, _event_loop
 
     _boot_time = datetime.now(timezone.utc).isoformat()
+    _event_loop = asyncio.get_running_loop()
     _store = Storage()
     _fusion = SignalFusion()
 
-    # Start background orchestrator
+    # Start background orchestrator (agent runs in one process, see _orchestrator_main)
     interval = int(os.getenv("ORCHESTRATOR_INTERVAL_SEC", "900"))  # 15 min
     _orchestrator_running = True
     _orchestrator_thread = threading.Thread(
-        target=_orchestrator_loop,
+        target=_orchestrator_main,
         args=(_store, interval),
         daemon=True,
         name="orchestrator",
@@ -1089,7 +1315,9 @@ async def lifespan(app: FastAPI):
     _orchestrator_thread.start()
     logger.info("Orchestrator started (interval=%ss)", interval)
 
-    # Start x402 facilitator retry if init failed
+    # Connect to the x402 facilitator; start the retry thread if that failed
+    if _X402_ENABLED:
+        await asyncio.to_thread(_x402_initialize)
     if _X402_AVAILABLE and _x402_init_pending:
         _x402_retry_thread = threading.Thread(
             target=_x402_retry_loop,
@@ -1138,6 +1366,9 @@ app = FastAPI(
     ),
     version="0.2.0",
     lifespan=lifespan,
+    # Routes returning plain dicts (health, analytics, reputation) encode with
+    # orjson when it is installed; the dashboard signal feeds use _dumps.
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
 )
 
 
@@ -1210,7 +1441,7 @@ def _classify_request_source(request: Request) -> str:
 
     # Layer 3: Pure admin/ops paths — no external user would hit these
     path = request.url.path
-    if (path == "/dashboard" or path.startswith("/analytics")
+    if (path == "/dashboard" or path.startswith("/static/") or path.startswith("/analytics")
             or path == "/health" or path.startswith("/admin")):
         return "internal"
 
@@ -1315,6 +1546,7 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
         "/health": "no-cache",
         "/signal": "public, max-age=900",            # 15 min — matches signal refresh
         "/api/signal": "no-cache",                    # internal mirror: always fresh for dashboard
+        "/api/bootstrap": "private, max-age=10, stale-while-revalidate=30",  # dashboard signal+health; gated, so never shared
         "/performance/reputation": "public, max-age=3600",  # 1 hour (public paid contract)
         "/api/performance/reputation": "no-cache",    # internal mirror: always fresh for dashboard
     }
@@ -1585,9 +1817,98 @@ async def health():
 # ---------------------------------------------------------------------------
 @app.get("/api/signal", tags=["internal"], include_in_schema=False)
 async def get_signal_internal(request: Request):
-    """Same data as /signal but free — used by the dashboard UI."""
+    """Same data as /signal but free — used by the dashboard UI.
+
+    Polls that already hold the current snapshot get an empty 304.
+    """
+    _require_internal(request)
+    etag, variants = _dashboard_entity(await get_signal())
+    status, body, headers = conditional_response(
+        etag,
+        variants,
+        request.headers.get("accept-encoding", ""),
+        request.headers.get("if-none-match", ""),
+    )
+    return Response(body, status_code=status, media_type="application/json", headers=headers)
+
+
+# ---------------------------------------------------------------------------
+# GET /api/bootstrap — dashboard signal + health in one round trip
+# ---------------------------------------------------------------------------
+# (encoded signal view, encoded health, (etag, compressed variants))
+_bootstrap_cache: tuple = (None, None, None)
+
+
+@app.get("/api/bootstrap", tags=["internal"], include_in_schema=False)
+async def get_bootstrap(request: Request):
+    """``{"signal": <dashboard view>, "health": <health>}`` for the dashboard.
+
+    The signal half reuses the view's cached encoding, and the combined
+    entity is only recompressed when either half changes. Polls that
+    already hold it get an empty 304.
+    """
+    global _bootstrap_cache
     _require_internal(request)
-    return await get_signal()
+    # Both handlers make blocking storage calls, so they run one after the other.
+    result = await get_signal()
+    health_data = await health()
+    signal_body = _dashboard_body(result)
+    health_body = _dumps(health_data)
+    if _bootstrap_cache[0] is not signal_body or _bootstrap_cache[1] != health_body:
+        body = b'{"signal":' + signal_body + b',"health":' + health_body + b"}"
+        _bootstrap_cache = (signal_body, health_body, precompress_json(body))
+    etag, variants = _bootstrap_cache[2]
+    status, body, headers = conditional_response(
+        etag,
+        variants,
+        request.headers.get("accept-encoding", ""),
+        request.headers.get("if-none-match", ""),
+    )
+    return Response(body, status_code=status, media_type="application/json", headers=headers)
+
+
+# ---------------------------------------------------------------------------
+# GET /api/signal/stream — SSE push of signal updates for the dashboard
+# ---------------------------------------------------------------------------
+@app.get("/api/signal/stream", tags=["internal"], include_in_schema=False)
+async def get_signal_stream(request: Request, since: Optional[str] = None):
+    """Full snapshot on connect, then per-asset deltas after each fusion run.
+
+    Event ids are the result timestamp: a client that already holds the
+    current result (``?since=`` on first connect, Last-Event-ID on
+    reconnect) skips the initial snapshot.
+    """
+    _require_internal(request)
+    result = await get_signal()
+    snapshot, snapshot_body = _dashboard_view(result), _dashboard_body(result)
+    known = request.headers.get("last-event-id") or since
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+    _signal_subscribers.add(queue)
+
+    async def events():
+        prev = snapshot
+        try:
+            if not known or known != str(snapshot.get("timestamp")):
+                yield _sse("snapshot", snapshot, snapshot_body)
+            while True:
+                try:
+                    result = await asyncio.wait_for(queue.get(), timeout=25)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"  # keeps proxies from idling out the connection
+                    continue
+                result = _dashboard_view(result)
+                delta = _signal_delta(prev, result)
+                prev = result
+                if delta:
+                    yield _sse("delta", delta)
+        finally:
+            _signal_subscribers.discard(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -2925,8 +3246,35 @@ Sitemap: none
 # GET /dashboard — Production UI
 # ---------------------------------------------------------------------------
 @app.get("/dashboard", tags=["ui"], include_in_schema=False)
-async def dashboard():
-    return HTMLResponse(DASHBOARD_HTML)
+async def dashboard(request: Request):
+    # Minified + precompressed once at import; just pick the encoding. The
+    # <head> goes out as its own chunk so the stylesheet fetch starts before
+    # the rest of the page has arrived.
+    status, chunks, headers = dashboard_response(
+        request.headers.get("accept-encoding", ""),
+        request.headers.get("if-none-match", ""),
+    )
+    if status == 304:
+        return Response(status_code=304, headers=headers)
+
+    async def body():
+        for chunk in chunks:
+            yield chunk
+
+    return StreamingResponse(body(), media_type="text/html; charset=utf-8", headers=headers)
+
+
+@app.get("/static/{filename}", include_in_schema=False)
+async def dashboard_static(filename: str, request: Request):
+    """Content-hashed dashboard assets (stylesheet, script, fetch worker)."""
+    status, body, headers = static_response(
+        filename,
+        request.headers.get("accept-encoding", ""),
+        request.headers.get("if-none-match", ""),
+    )
+    if status == 404:
+        raise HTTPException(404, detail="Unknown static asset")
+    return Response(body, status_code=status, headers=headers)
 
 
 # ---------------------------------------------------------------------------
@@ -3092,11 +3440,3 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
-
-# ---------------------------------------------------------------------------
-# Entry point
-# ---------------------------------------------------------------------------
-if __name__ == "__main__":
-    import uvicorn
-    port = int(os.getenv("PORT", 8000))
-    uvicorn.run("api.server:app", host="0.0.0.0", port=port, reload=False)
@@ -19,7 +19,6 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
-from scipy.optimize import minimize
 
 
 class SignalCalibrator:
@@ -106,6 +105,8 @@ class SignalCalibrator:
         if len(distances) < min_samples:
             return False
 
+        from scipy.optimize import minimize
+
         # Platt scaling: minimize negative log-likelihood
         def neg_log_likelihood(params: np.ndarray) -> float:
             A, B = params